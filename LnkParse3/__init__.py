@@ -1,3 +1,4 @@
-__all__ = ["lnk_file"]
+__all__ = ["lnk_file", "shortcut_target"]
 
 from LnkParse3.lnk_file import LnkFile as lnk_file
+from LnkParse3.lnk_file import shortcut_target
@@ -0,0 +1,299 @@
+"""
+Parsing of many LNK files at once, e.g. a whole directory tree collected from
+a triage image. Files are fanned out to a process pool and results are yielded
+as they are produced, one record per file tagged with its path. `aparse_many`
+offers the same for asyncio services.
+"""
+
+import asyncio
+import functools
+import os
+import warnings
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from pathlib import Path
+
+from LnkParse3.item_cache import ItemCache
+from LnkParse3.lnk_file import LnkFile
+from LnkParse3.lnk_file import shortcut_target
+from LnkParse3.ndjson import json_ready
+
+
+# HeaderSize == 0x0000004C followed by LinkCLSID 00021401-0000-0000-C000-000000000046
+LNK_MAGIC = b"\x4c\x00\x00\x00\x01\x14\x02\x00\x00\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x00\x46"
+
+
+def iter_files(root):
+    """
+    Recursively yield paths of all regular files under `root` using
+    `os.scandir`. Symbolic links to directories are not followed.
+    """
+    if not Path(root).is_dir():
+        yield root
+        return
+
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path
+                    except OSError as e:
+                        warnings.warn(f"Error while scanning `{entry.path}` ({e})")
+        except OSError as e:
+            warnings.warn(f"Error while scanning `{directory}` ({e})")
+
+
+def is_lnk(indata):
+    return indata[: len(LNK_MAGIC)] == LNK_MAGIC
+
+
+@functools.cache
+def _process_item_cache():
+    # One cache per worker process, shared by its threads, it lives as long
+    # as the process.
+    return ItemCache()
+
+
+def _lnk_record(indata, cp, print_all, target_only, cache_items=False):
+    if target_only:
+        return {"shortcut_target": shortcut_target(indata=indata, cp=cp)}
+
+    lnk = LnkFile(indata=indata, cp=cp, item_cache=_process_item_cache() if cache_items else None)
+    record = json_ready(lnk.get_json(print_all))
+    if lnk.diagnostics:
+        record["diagnostics"] = lnk.diagnostics.as_list()
+    return record
+
+
+def parse_path(path, cp=None, print_all=False, target_only=False, cache_items=False):
+    """
+    Parse a single file and return its record, or `None` when the file does
+    not start with the LNK magic. Datetimes in the record are already
+    converted to strings, so it is ready for `NDJSONWriter`. With
+    `cache_items`, shell items are shared through a per-process `ItemCache`.
+    """
+    record = {"path": path}
+    try:
+        with open(path, "rb") as fp:
+            magic = fp.read(len(LNK_MAGIC))
+
+        if not is_lnk(magic):
+            return None
+
+        # Map the file instead of reading it, trojanized shortcuts with huge
+        # appended payloads would otherwise be copied into every worker.
+        indata = LnkFile.read_path(path, mmap=True)
+        record.update(_lnk_record(indata, cp, print_all, target_only, cache_items))
+    except Exception as e:
+        # One malformed file must not stop the whole sweep.
+        record["error"] = repr(e)
+    return record
+
+
+def parse_data(indata, cp=None, print_all=False, target_only=False, cache_items=False):
+    """
+    Parse an in-memory LNK blob and return its record, see `parse_path`.
+    """
+    record = {}
+    try:
+        record.update(_lnk_record(indata, cp, print_all, target_only, cache_items))
+    except Exception as e:
+        record["error"] = repr(e)
+    return record
+
+
+def _parse_chunk(paths, cp, print_all, target_only, cache_items):
+    records = []
+    for path in paths:
+        record = parse_path(path, cp, print_all, target_only, cache_items)
+        if record is not None:
+            records.append(record)
+    return records
+
+
+def _parse_items(items, cp, print_all, target_only, cache_items):
+    records = []
+    for index, item in items:
+        if isinstance(item, (str, os.PathLike)):
+            record = parse_path(item, cp, print_all, target_only, cache_items)
+        else:
+            record = {"index": index}
+            record.update(parse_data(item, cp, print_all, target_only, cache_items))
+        if record is not None:
+            records.append(record)
+    return records
+
+
+def _target_paths_chunk(paths, cp):
+    results = []
+    for path in paths:
+        try:
+            with open(path, "rb") as fp:
+                if not is_lnk(fp.read(len(LNK_MAGIC))):
+                    continue
+
+            lnk = LnkFile.from_path(
+                path,
+                mmap=True,
+                cp=cp,
+                lazy=True,
+                sections=LnkFile.PATH_SECTIONS,
+                diagnostics=False,
+                validation="off",
+            )
+            target_path = lnk.target_path()
+        except Exception:
+            target_path = None
+        results.append((path, target_path))
+    return results
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def parse_many(
+    paths,
+    workers=None,
+    cp=None,
+    print_all=False,
+    target_only=False,
+    chunk_size=64,
+    cache_items=False,
+):
+    """
+    Parse all LNK files from `paths` on a pool of `workers` processes and
+    yield their records in completion order. Files without the LNK magic are
+    skipped. Only a bounded number of chunks is in flight at once, so `paths`
+    can be a lazy iterator over a huge tree. With `cache_items`, every worker
+    reuses the shell items it has already parsed, see `ItemCache`.
+    """
+    args = (cp, print_all, target_only, cache_items)
+    yield from _map_chunks(_parse_chunk, paths, workers, chunk_size, args)
+
+
+def _map_chunks(func, paths, workers, chunk_size, args):
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in _chunks(paths, chunk_size):
+            yield from func(chunk, *args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for chunk in _chunks(paths, chunk_size):
+            pending.add(executor.submit(func, chunk, *args))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def parse_tree(root, workers=None, cp=None, print_all=False, target_only=False, cache_items=False):
+    """
+    Parse every LNK file found under the directory `root`.
+    """
+    paths = iter_files(root)
+    yield from parse_many(
+        paths,
+        workers=workers,
+        cp=cp,
+        print_all=print_all,
+        target_only=target_only,
+        cache_items=cache_items,
+    )
+
+
+def index_target_paths(paths, trie, workers=None, cp=None, chunk_size=64):
+    """
+    Resolve the target paths of all LNK files from `paths` on a pool of
+    `workers` processes, add them to the `PathTrie` `trie` and yield
+    `(path, node)` pairs in completion order. `node` is `None` when the file
+    has no target path or cannot be parsed.
+    """
+    args = (cp,)
+    for path, target_path in _map_chunks(_target_paths_chunk, paths, workers, chunk_size, args):
+        yield path, trie.add(target_path) if target_path else None
+
+
+async def _abatches(items, size):
+    batch = []
+    if hasattr(items, "__aiter__"):
+        index = 0
+        async for item in items:
+            batch.append((index, item))
+            index += 1
+            if len(batch) == size:
+                yield batch
+                batch = []
+    else:
+        for index, item in enumerate(items):
+            batch.append((index, item))
+            if len(batch) == size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+async def aparse_many(
+    items,
+    executor=None,
+    batch_size=64,
+    max_pending=4,
+    cp=None,
+    print_all=False,
+    target_only=False,
+    cache_items=False,
+):
+    """
+    Asynchronously parse `items`, an iterable or an async iterable of file
+    paths or in-memory LNK blobs, and yield their records in completion
+    order.
+
+    Items are grouped into batches of `batch_size` which are read and parsed
+    on `executor` (the loop's default executor if `None`, pass
+    a `ProcessPoolExecutor` for CPU parallelism). At most `max_pending`
+    batches are in flight at once. Records of paths are tagged with `path`,
+    records of blobs with their `index` in `items`. With `cache_items`, the
+    threads of a thread pool share the `ItemCache` of their process.
+    """
+    loop = asyncio.get_running_loop()
+    args = (cp, print_all, target_only, cache_items)
+    pending = set()
+    try:
+        async for batch in _abatches(items, batch_size):
+            pending.add(loop.run_in_executor(executor, _parse_items, batch, *args))
+            if len(pending) >= max_pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    for record in future.result():
+                        yield record
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                for record in future.result():
+                    yield record
+    finally:
+        for future in pending:
+            future.cancel()
@@ -1,29 +1,100 @@
 import functools
-import warnings
+import struct
+from types import MethodType
 
+from LnkParse3.diagnostics import format_message
+from LnkParse3.exceptions import LnkParserError
 from LnkParse3.utils import parse_dostime
 from LnkParse3.utils import parse_filetime
 from LnkParse3.utils import parse_packed_uuid
 from LnkParse3.utils import parse_uuid
 
 
-def must_be(expected):
-    def outer(func):
-        @functools.wraps(func)
-        def inner(self, *args, **kwargs):
-            result = func(self, *args, **kwargs)
+# "off" skips the checks, "warn" reports a mismatch to the diagnostics of
+# the object and "strict" raises `LnkParserError`.
+VALIDATION_LEVELS = ("off", "warn", "strict")
 
-            if result != expected:
-                msg = "%s must be %s: %s" % (func.__name__, expected, result)
-                warnings.warn(msg)
 
-            return result
+def must_be(expected):
+    """
+    Declare the value an accessor MUST return. The accessor itself is left
+    untouched, `validate` checks the value once when the structure is decoded.
+    """
 
-        return inner
+    def outer(func):
+        func.must_be = expected
+        return func
 
     return outer
 
 
+@functools.cache
+def _checks(cls):
+    checks = {}
+    for klass in reversed(cls.__mro__):
+        for name, attr in vars(klass).items():
+            if hasattr(attr, "must_be"):
+                checks[name] = attr.must_be
+    return tuple(checks.items())
+
+
+def validate(obj, validation="warn"):
+    """
+    Run all `must_be` checks of `obj` according to the `validation` level.
+    """
+    if validation == "off":
+        return
+
+    for name, expected in _checks(type(obj)):
+        try:
+            result = getattr(obj, name)()
+        except struct.error:
+            # Truncated, reading the value raises the error again.
+            continue
+
+        if result != expected:
+            if validation == "strict":
+                raise LnkParserError(format_message("unexpected-value", (name, expected, result)))
+            obj.diagnostics.report("unexpected-value", name, expected, result)
+
+
+class cached_field:  # noqa: N801
+    """
+    Decode a field accessor at most once per object.
+
+    The value is decoded on the first call and kept in the instance
+    `__dict__` under the accessor's name. This (data) descriptor takes
+    precedence over that entry and returns a method bound to the shared
+    descriptor, so nothing but the value itself is stored per object.
+    Classes defining `__slots__` without `__dict__` cannot use it. Every call
+    returns the very same object, e.g. the `ShellFSFolder` of
+    `UsersFilesFolder.file_entry`, callers must not modify it.
+    """
+
+    def __init__(self, func):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.name = func.__name__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return MethodType(self, obj)
+
+    def __set__(self, obj, value):
+        raise AttributeError(f"cached field `{self.name}` is read-only")
+
+    def __call__(self, obj):
+        values = obj.__dict__
+        if self.name in values:
+            return values[self.name]
+        value = values[self.name] = self.func(obj)
+        return value
+
+
 def uuid(func):
     @functools.wraps(func)
     def inner(self, *args, **kwargs):
@@ -49,7 +120,7 @@ def filetime(func):
     def inner(self, *args, **kwargs):
         binary = func(self, *args, **kwargs)
 
-        return parse_filetime(binary)
+        return parse_filetime(binary, self.diagnostics, self.timestamps)
 
     return inner
 
@@ -59,6 +130,6 @@ def dostime(func):
     def inner(self, *args, **kwargs):
         binary = func(self, *args, **kwargs)
 
-        return parse_dostime(binary)
+        return parse_dostime(binary, self.diagnostics, self.timestamps)
 
     return inner
@@ -0,0 +1,93 @@
+"""
+Anomalies found while parsing, e.g. invalid timestamps or unknown shell item
+types. Structures report them with a short code and the values involved, the
+human readable message is formatted only when it is asked for.
+
+Every `LnkFile` collects its own `Diagnostics`. Structures used on their own
+report to `WARNINGS`, which forwards each anomaly to `warnings.warn`.
+"""
+
+import warnings
+from collections import Counter
+
+
+MESSAGES = {
+    "unexpected-value": "{} must be {}: {}",
+    "invalid-filetime": "Invalid filetime: {}",
+    "invalid-dostime": "Invalid dostime: {}",
+    "undecodable-string": "Error while decoding string `{}` ({})",
+    "unknown-item-type": (
+        "Not implemented item_type 0x{:02X} in TargetFactory.SHELL_ITEM_CLASSES. "
+        "Use fallback value: {!r}."
+    ),
+    "unknown-fs-folder-flags": (
+        "Not implemented flags 0x{:02X} in LnkTargetBase.SHELL_ITEM_SHELL_FS_FOLDER. "
+        'Use fallback value: "Unknown".'
+    ),
+    "unknown-sort-index": (
+        "Not implemented sort_index_value {:02X} in RootFolder.SORT_INDEX. "
+        'Use fallback value: "Unknown".'
+    ),
+    "unknown-category": (
+        "Not implemented category_id {} in ControlPanelCategory.CATEGORIES. "
+        'Use fallback value: "Unknown".'
+    ),
+    "invalid-target": "Error while parsing TargetID `{}` (KeyError {})",
+    "invalid-extra-target": "Error while parsing extra TargetID `{}` (KeyError {})",
+    "truncated-string-data": "Error while parsing String data: {!r}",
+    "truncated-info": "Error while selecting proper Info class: {!r}",
+    "truncated-extra-data": "Error while parsing extra data: {!r}",
+    "truncated-extra-signature": "Error while parsing extra's signature {}",
+    "invalid-extra-block": "Error while parsing `{}` ({})",
+}
+
+
+def format_message(code, args):
+    return MESSAGES[code].format(*args)
+
+
+class Diagnostics:
+    """
+    Collect anomalies of one parse. `counts` holds the number of reports per
+    code, `messages()` formats them. A disabled instance drops every report.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.counts = Counter()
+        self._records = []
+        if not enabled:
+            self.report = self._ignore
+
+    def report(self, code, *args):
+        self.counts[code] += 1
+        self._records.append((code, args))
+
+    def _ignore(self, code, *args):
+        pass
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def messages(self):
+        return [format_message(code, args) for code, args in self._records]
+
+    def as_list(self):
+        return [
+            {"code": code, "message": format_message(code, args)} for code, args in self._records
+        ]
+
+
+class WarningsDiagnostics(Diagnostics):
+    """
+    Forward every report to `warnings.warn` instead of collecting it.
+    """
+
+    def report(self, code, *args):
+        warnings.warn(format_message(code, args))
+
+
+WARNINGS = WarningsDiagnostics()
@@ -1,5 +1,6 @@
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.extra.lnk_extra_base import LnkExtraBase
 
 
@@ -20,6 +21,7 @@ class CodePage(LnkExtraBase):
     def name(self):
         return "CONSOLE_CODEPAGE_BLOCK"
 
+    @cached_field
     def code_page(self):
         start, end = 8, 12
         return unpack("<I", self._raw[start:end])[0]
@@ -1,5 +1,6 @@
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.extra.lnk_extra_base import LnkExtraBase
 
 
@@ -58,50 +59,62 @@ class Console(LnkExtraBase):
     def name(self):
         return "CONSOLE_PROPERTIES_BLOCK"
 
+    @cached_field
     def fill_attributes(self):
         start, end = 8, 10
         return unpack("<H", self._raw[start:end])[0]
 
+    @cached_field
     def popup_fill_attributes(self):
         start, end = 10, 12
         return unpack("<H", self._raw[start:end])[0]
 
+    @cached_field
     def screen_buffer_size_x(self):
         start, end = 12, 14
         return unpack("<h", self._raw[start:end])[0]
 
+    @cached_field
     def screen_buffer_size_y(self):
         start, end = 14, 16
         return unpack("<h", self._raw[start:end])[0]
 
+    @cached_field
     def window_size_x(self):
         start, end = 16, 18
         return unpack("<h", self._raw[start:end])[0]
 
+    @cached_field
     def window_size_y(self):
         start, end = 18, 20
         return unpack("<h", self._raw[start:end])[0]
 
+    @cached_field
     def window_origin_x(self):
         start, end = 20, 22
         return unpack("<h", self._raw[start:end])[0]
 
+    @cached_field
     def window_origin_y(self):
         start, end = 22, 24
         return unpack("<h", self._raw[start:end])[0]
 
+    @cached_field
     def font_size(self):
         start, end = 32, 36
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def font_family(self):
         start, end = 36, 40
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def font_weight(self):
         start, end = 40, 44
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def face_name(self):
         start = 44
         end = start + 64
@@ -109,38 +122,47 @@ class Console(LnkExtraBase):
         text = self.text_processor.read_unicode_string(binary)
         return text
 
+    @cached_field
     def cursor_size(self):
         start, end = 108, 112
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def full_screen(self):
         start, end = 112, 116
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def quick_edit(self):
         start, end = 116, 120
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def insert_mode(self):
         start, end = 120, 124
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def auto_position(self):
         start, end = 124, 128
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def history_buffer_size(self):
         start, end = 128, 132
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def number_of_history_buffers(self):
         start, end = 132, 136
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def history_no_dup(self):
         start, end = 136, 140
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def color_table(self):
         start, end = 140, 144
         return unpack("<I", self._raw[start:end])[0]
@@ -1,3 +1,4 @@
+from LnkParse3.decorators import cached_field
 from LnkParse3.decorators import packed_uuid
 from LnkParse3.extra.lnk_extra_base import LnkExtraBase
 
@@ -39,6 +40,7 @@ class Darwin(LnkExtraBase):
     def name(self):
         return "DARWIN_BLOCK"
 
+    @cached_field
     def darwin_data_ansi(self):
         start = 8
         end = start + 260
@@ -46,6 +48,7 @@ class Darwin(LnkExtraBase):
         text = self.text_processor.read_string(binary)
         return text
 
+    @cached_field
     def darwin_data_unicode(self):
         start = 268
         end = start + 520
@@ -53,6 +56,7 @@ class Darwin(LnkExtraBase):
         text = self.text_processor.read_unicode_string(binary)
         return text
 
+    @cached_field
     @packed_uuid
     def product_code_id(self):
         data = self.darwin_data_unicode()
@@ -60,6 +64,7 @@ class Darwin(LnkExtraBase):
         text = data[start:end]
         return text
 
+    @cached_field
     def feature_name(self):
         data = self.darwin_data_unicode()
         start = 20
@@ -77,6 +82,7 @@ class Darwin(LnkExtraBase):
         text = data[start:end]
         return text
 
+    @cached_field
     @packed_uuid
     def component_id(self):
         data = self.darwin_data_unicode()
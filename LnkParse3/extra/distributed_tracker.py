@@ -1,5 +1,6 @@
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.decorators import must_be
 from LnkParse3.decorators import uuid
 from LnkParse3.extra.lnk_extra_base import LnkExtraBase
@@ -40,6 +41,7 @@ class DistributedTracker(LnkExtraBase):
         return "DISTRIBUTED_LINK_TRACKER_BLOCK"
 
     @must_be(0x00000058)
+    @cached_field
     def length(self):
         """Length (4 bytes):
         A 32-bit, unsigned integer that specifies the size of the rest of the
@@ -51,6 +53,7 @@ class DistributedTracker(LnkExtraBase):
         return length
 
     @must_be(0x00000000)
+    @cached_field
     def version(self):
         """Version (4 bytes):
         A 32-bit, unsigned integer. This value MUST be 0x00000000.
@@ -59,6 +62,7 @@ class DistributedTracker(LnkExtraBase):
         version = unpack("<I", self._raw[start:end])[0]
         return version
 
+    @cached_field
     def machine_id(self):
         """MachineID (16 bytes):
         A NULL-terminated character string, as defined by
@@ -70,24 +74,28 @@ class DistributedTracker(LnkExtraBase):
         text = self.text_processor.read_string(binary)
         return text
 
+    @cached_field
     @uuid
     def droid_volume_id(self):
         start, end = 32, 48
         binary = self._raw[start:end]
         return binary
 
+    @cached_field
     @uuid
     def droid_file_id(self):
         start, end = 48, 64
         binary = self._raw[start:end]
         return binary
 
+    @cached_field
     @uuid
     def droid_birth_volume_id(self):
         start, end = 64, 80
         binary = self._raw[start:end]
         return binary
 
+    @cached_field
     @uuid
     def droid_birth_file_id(self):
         start, end = 80, 96
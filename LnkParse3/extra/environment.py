@@ -1,3 +1,4 @@
+from LnkParse3.decorators import cached_field
 from LnkParse3.extra.lnk_extra_base import LnkExtraBase
 
 
@@ -22,6 +23,7 @@ class Environment(LnkExtraBase):
     def name(self):
         return "ENVIRONMENTAL_VARIABLES_LOCATION_BLOCK"
 
+    @cached_field
     def target_ansi(self):
         start = 8
         end = start + 260
@@ -29,6 +31,7 @@ class Environment(LnkExtraBase):
         text = self.text_processor.read_string(binary)
         return text
 
+    @cached_field
     def target_unicode(self):
         start = 268
         end = start + 520
@@ -1,5 +1,6 @@
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.decorators import uuid
 from LnkParse3.extra.lnk_extra_base import LnkExtraBase
 
@@ -24,12 +25,14 @@ class KnownFolder(LnkExtraBase):
     def name(self):
         return "KNOWN_FOLDER_LOCATION_BLOCK"
 
+    @cached_field
     @uuid
     def known_folder_id(self):
         start, end = 8, 24
         binary = self._raw[start:end]
         return binary
 
+    @cached_field
     def offset(self):
         start, end = 24, 28
         return unpack("<I", self._raw[start:end])[0]
@@ -1,6 +1,9 @@
 from struct import unpack
 
-from LnkParse3.text_processor import TextProcessor
+from LnkParse3.decorators import cached_field
+from LnkParse3.decorators import validate
+from LnkParse3.diagnostics import WARNINGS
+from LnkParse3.text_processor import get_text_processor
 
 
 """
@@ -13,11 +16,25 @@ from LnkParse3.text_processor import TextProcessor
 
 
 class LnkExtraBase:
-    def __init__(self, indata=None, cp=None):
+    def __init__(
+        self,
+        indata=None,
+        cp=None,
+        diagnostics=WARNINGS,
+        validation="warn",
+        text_processor=None,
+        timestamps="datetime",
+    ):
         self._raw = indata
         self.cp = cp
-        self.text_processor = TextProcessor(cp=cp)
+        self.diagnostics = diagnostics
+        # Representation of the times, see `LnkFile.TIMESTAMPS`
+        self.timestamps = timestamps
+        self.text_processor = text_processor or get_text_processor(cp, diagnostics)
 
+        validate(self, validation)
+
+    @cached_field
     def size(self):
         start, end = 0, 4
         size = unpack("<I", self._raw[start:end])[0]
@@ -1,5 +1,4 @@
-import warnings
-
+from LnkParse3.decorators import cached_field
 from LnkParse3.extra.lnk_extra_base import LnkExtraBase
 from LnkParse3.lnk_targets import TargetFactory
 
@@ -18,9 +17,29 @@ from LnkParse3.lnk_targets import TargetFactory
 
 
 class ShellItem(LnkExtraBase):
+    def __init__(self, *args, link_targets=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # `LnkTargets` of the same file, its items are reused when both
+        # IDLists are identical.
+        self.link_targets = link_targets
+
     def name(self):
         return "SHELL_ITEM_IDENTIFIER_BLOCK"
 
+    @cached_field
+    def _raw_id_list(self):
+        return self._raw[8 : self.size()]
+
+    @cached_field
+    def id_list_differs(self):
+        """
+        Whether the IDList is not a byte-identical copy of the
+        LinkTargetIDList of the file, `None` when the file has none.
+        """
+        if self.link_targets is None:
+            return None
+        return self._raw_id_list() != self.link_targets.raw_id_list()
+
     def _id_list(self):
         """ItemIDList (variable):
         An array of zero or more ItemID structures (section 2.2.2), which
@@ -39,20 +58,22 @@ class ShellItem(LnkExtraBase):
         |         TerminalID           |
         --------------------------------
         """
-        rest = self._raw[8 : self.size()]
-        while rest:
-            factory = TargetFactory(indata=rest)
-            target_class = factory.target_class()
-
-            if not target_class:
-                # Empty or unknown target object.
-                break
+        return iter(self._targets())
 
-            target = target_class(indata=rest, cp=self.cp)
+    @cached_field
+    def _targets(self):
+        if self.id_list_differs() is False:
+            # A copy of the LinkTargetIDList, share its parsed items.
+            return tuple(self.link_targets)
 
-            size = factory.item_size()
-            rest = rest[size:]
-            yield target
+        # The same IDList engine as `LnkTargets`.
+        return TargetFactory.targets(
+            self._raw_id_list(),
+            cp=self.cp,
+            diagnostics=self.diagnostics,
+            text_processor=self.text_processor,
+            timestamps=self.timestamps,
+        )
 
     def id_list(self):
         res = []
@@ -60,12 +81,12 @@ class ShellItem(LnkExtraBase):
             try:
                 res.append(target.as_item())
             except KeyError as e:
-                msg = f"Error while parsing extra TargetID `{target.name}` (KeyError {e})"
-                warnings.warn(msg)
+                self.diagnostics.report("invalid-extra-target", target.name, e)
                 continue
         return res
 
     def as_dict(self):
         tmp = super().as_dict()
         tmp["id_list"] = self.id_list()
+        tmp["id_list_differs"] = self.id_list_differs()
         return tmp
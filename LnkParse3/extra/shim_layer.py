@@ -1,3 +1,4 @@
+from LnkParse3.decorators import cached_field
 from LnkParse3.extra.lnk_extra_base import LnkExtraBase
 
 
@@ -19,6 +20,7 @@ class ShimLayer(LnkExtraBase):
     def name(self):
         return "SHIM_LAYER_BLOCK"
 
+    @cached_field
     def layer_name(self):
         start = 8
         binary = self._raw[start:]
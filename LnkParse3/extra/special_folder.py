@@ -1,5 +1,6 @@
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.extra.lnk_extra_base import LnkExtraBase
 
 
@@ -22,10 +23,12 @@ class SpecialFolder(LnkExtraBase):
     def name(self):
         return "SPECIAL_FOLDER_LOCATION_BLOCK"
 
+    @cached_field
     def special_folder_id(self):
         start, end = 8, 12
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def offset(self):
         start, end = 12, 16
         return unpack("<I", self._raw[start:end])[0]
@@ -28,15 +28,18 @@ class Terminal(LnkExtraBase):
     def name(self):
         return "TERMINAL_BLOCK"
 
-    def appended_data(self):
+    def _appended_data(self):
         start = 4
         return self._raw[start:]
 
+    def appended_data(self):
+        return bytes(self._appended_data())
+
     # Overwrite the usual size with the real appended data length
     def size(self):
-        return 4 + len(self.appended_data())
+        return 4 + len(self._appended_data())
 
     def as_dict(self):
         tmp = super().as_dict()
-        tmp["appended_data_sha256"] = hashlib.sha256(self.appended_data()).hexdigest()
+        tmp["appended_data_sha256"] = hashlib.sha256(self._appended_data()).hexdigest()
         return tmp
@@ -14,11 +14,14 @@ class Unknown(LnkExtraBase):
     def name(self):
         return "UNKNOWN_BLOCK"
 
-    def extra_data(self):
+    def _extra_data(self):
         start = 4
         return self._raw[start:]
 
+    def extra_data(self):
+        return bytes(self._extra_data())
+
     def as_dict(self):
         tmp = super().as_dict()
-        tmp["extra_data_sha256"] = hashlib.sha256(self.extra_data()).hexdigest()
+        tmp["extra_data_sha256"] = hashlib.sha256(self._extra_data()).hexdigest()
         return tmp
@@ -1,7 +1,8 @@
-import warnings
 from struct import error as StructError  # noqa: N812
 from struct import unpack
 
+from LnkParse3.diagnostics import WARNINGS
+from LnkParse3.extra.shell_item import ShellItem
 from LnkParse3.extra.terminal import Terminal
 from LnkParse3.extra.unknown import Unknown
 from LnkParse3.extra_factory import ExtraFactory
@@ -14,25 +15,51 @@ A structure consisting of zero or more property data blocks followed by a termin
 
 
 class ExtraData:
-    def __init__(self, indata=None, cp=None, allow_terminal_blocks=True):
+    def __init__(
+        self,
+        indata=None,
+        cp=None,
+        allow_terminal_blocks=True,
+        lazy=False,
+        diagnostics=WARNINGS,
+        validation="warn",
+        link_targets=None,
+        text_processor=None,
+        timestamps="datetime",
+    ):
         self.cp = cp
         self._raw = indata
+        self.diagnostics = diagnostics
+        # Passed down to the blocks, `None` lets every block make its own.
+        self.text_processor = text_processor
+        self.timestamps = timestamps
+        self.validation = validation
         self.allow_terminal_blocks = allow_terminal_blocks
+        # Passed to `ShellItem` blocks to reuse the already parsed IDList.
+        self.link_targets = link_targets
 
         self.process()
 
+        if not lazy:
+            self._build()
+
     def __iter__(self):
         return iter(self.data)
 
     def process(self):
-        self.data = []
+        """
+        Walk the block sizes and remember where each block lives. Block
+        objects are created on the first access to `data`.
+        """
+        self._data = None
+        self._blocks = []
         rest = self._raw
         while rest:
-            factory = ExtraFactory(indata=rest)
+            factory = ExtraFactory(indata=rest, diagnostics=self.diagnostics)
             try:
                 size = factory.item_size()
             except StructError as e:
-                warnings.warn(f"Error while parsing extra data: {e!r}")
+                self.diagnostics.report("truncated-extra-data", e)
                 break
 
             if not size:
@@ -42,16 +69,36 @@ class ExtraData:
 
             cls = factory.extra_class()
             if cls:
-                extra = cls(indata=data, cp=self.cp)
-                self.data.append(extra)
+                self._blocks.append((cls, data, size))
 
         # If there is data following the Terminal Block, we should take note of it and tell the user.
         if self.allow_terminal_blocks and len(rest) > 4 and unpack("<I", rest[:4])[0] < 0x00000004:
-            extra = Terminal(indata=rest, cp=self.cp)
-            self.data.append(extra)
+            self._blocks.append((Terminal, rest, len(rest)))
+
+    def _build(self):
+        self._data = []
+        for cls, data, _ in self._blocks:
+            kwargs = {"link_targets": self.link_targets} if cls is ShellItem else {}
+            self._data.append(
+                cls(
+                    indata=data,
+                    cp=self.cp,
+                    diagnostics=self.diagnostics,
+                    validation=self.validation,
+                    text_processor=self.text_processor,
+                    timestamps=self.timestamps,
+                    **kwargs,
+                )
+            )
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._build()
+        return self._data
 
     def size(self) -> int:
-        return sum(extra.size() for extra in self.data)
+        return sum(size for _, _, size in self._blocks)
 
     def as_dict(self):
         res = {}
@@ -64,7 +111,6 @@ class ExtraData:
                 else:
                     res[extra.name()] = extra.as_dict()
             except (StructError, ValueError) as e:
-                msg = "Error while parsing `%s` (%s)" % (extra.name(), e)
-                warnings.warn(msg)
+                self.diagnostics.report("invalid-extra-block", extra.name(), e)
                 continue
         return res
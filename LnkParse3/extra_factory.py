@@ -1,7 +1,7 @@
 import struct
-import warnings
 from struct import unpack
 
+from LnkParse3.diagnostics import WARNINGS
 from LnkParse3.extra.code_page import CodePage
 from LnkParse3.extra.console import Console
 from LnkParse3.extra.darwin import Darwin
@@ -42,8 +42,9 @@ class ExtraFactory:
         "a000000c": ShellItem,
     }
 
-    def __init__(self, indata):
+    def __init__(self, indata, diagnostics=WARNINGS):
         self._raw = indata
+        self.diagnostics = diagnostics
 
     def item_size(self):
         start, end = 0, 4
@@ -61,5 +62,5 @@ class ExtraFactory:
             sig = str(hex(self._rsig()))[2:]  # huh?
             return self.EXTRA_SIGS.get(sig, Unknown)
         except struct.error as e:
-            warnings.warn(f"Error while parsing extra's signature {e}")
+            self.diagnostics.report("truncated-extra-signature", e)
             return None
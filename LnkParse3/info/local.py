@@ -1,5 +1,6 @@
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.lnk_info import LnkInfo
 
 
@@ -37,35 +38,42 @@ class Local(LnkInfo):
     def location(self):
         return "Local"
 
+    @cached_field
     def volume_id_size(self):
         start = self.volume_id_offset()
         end = start + 4
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def r_drive_type(self):
         start = self.volume_id_offset() + 4
         end = start + 4
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def drive_serial_number(self):
         start = self.volume_id_offset() + 8
         end = start + 4
         number = unpack("<I", self._raw[start:end])[0]
         return hex(number)
 
+    @cached_field
     def volume_label_offset(self):
         start = self.volume_id_offset() + 12
         end = start + 4
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def drive_type(self):
         if self.r_drive_type() < len(self.DRIVE_TYPES):
             return self.DRIVE_TYPES[self.r_drive_type()]
         return None
 
+    @cached_field
     def _has_volume_label_offset_unicode(self):
         return bool(self.volume_label_offset() == 0x00000014)
 
+    @cached_field
     def volume_label(self):
         if self._has_volume_label_offset_unicode():
             return None
@@ -76,6 +84,7 @@ class Local(LnkInfo):
         text = self.text_processor.read_string(binary)
         return text
 
+    @cached_field
     def volume_label_unicode_offset(self):
         if not self._has_volume_label_offset_unicode():
             return None
@@ -84,6 +93,7 @@ class Local(LnkInfo):
         end = start + 4
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def volume_label_unicode(self):
         if not self.volume_label_unicode_offset():
             return None
@@ -1,5 +1,6 @@
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.lnk_info import LnkInfo
 
 
@@ -84,32 +85,38 @@ class Network(LnkInfo):
     def location(self):
         return "Network"
 
+    @cached_field
     def common_network_relative_link_size(self):
         start = self.common_network_relative_link_offset()
         end = start + 4
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def common_network_relative_link_flags(self):
         start = self.common_network_relative_link_offset() + 4
         end = start + 4
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def net_name_offset(self):
         start = self.common_network_relative_link_offset() + 8
         end = start + 4
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def device_name_offset(self):
         start = self.common_network_relative_link_offset() + 12
         end = start + 4
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def r_network_provider_type(self):
         start = self.common_network_relative_link_offset() + 16
         end = start + 4
         provider_type = unpack("<I", self._raw[start:end])[0]
         return hex(provider_type)
 
+    @cached_field
     def network_provider_type(self):
         # TODO: explain
         if not self.common_network_relative_link_flags() & 0x0002:
@@ -118,6 +125,7 @@ class Network(LnkInfo):
             return None
         return self.NETWORK_PROVIDER_TYPES[self.r_network_provider_type()]
 
+    @cached_field
     def net_name_offset_unicode(self):
         if self.net_name_offset() <= 20:
             return None
@@ -125,6 +133,7 @@ class Network(LnkInfo):
         end = start + 4
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def net_name_unicode(self):
         if self.net_name_offset() <= 20:
             return None
@@ -136,6 +145,7 @@ class Network(LnkInfo):
         text = self.text_processor.read_unicode_string(binary)
         return text
 
+    @cached_field
     def device_name_offset_unicode(self):
         if self.net_name_offset() <= 20:
             return None
@@ -143,6 +153,7 @@ class Network(LnkInfo):
         end = start + 4
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def device_name_unicode(self):
         if self.net_name_offset() <= 20:
             return None
@@ -154,6 +165,7 @@ class Network(LnkInfo):
         text = self.text_processor.read_unicode_string(binary)
         return text
 
+    @cached_field
     def net_name(self):
         if self.net_name_offset() > 20:
             return None
@@ -165,6 +177,7 @@ class Network(LnkInfo):
         text = self.text_processor.read_string(binary)
         return text
 
+    @cached_field
     def device_name(self):
         if self.net_name_offset() > 20:
             return None
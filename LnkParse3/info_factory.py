@@ -1,5 +1,4 @@
 import struct
-import warnings
 
 from LnkParse3.info.local import Local
 from LnkParse3.info.network import Network
@@ -43,5 +42,5 @@ class InfoFactory:
                 return Network
             return None
         except struct.error as e:
-            warnings.warn(f"Error while selecting proper Info class: {e!r}")
+            self._lnk_info.diagnostics.report("truncated-info", e)
             return None
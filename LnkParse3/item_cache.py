@@ -0,0 +1,87 @@
+"""
+Cache of parsed shell items shared by many LNK files. Most IDLists of a corpus
+start with the same ItemIDs, e.g. the My Computer root, the `C:\\` volume and
+`Users`, so identical items are decoded once and the parsed target is reused.
+"""
+
+import threading
+from collections import OrderedDict
+
+from LnkParse3.diagnostics import Diagnostics
+
+
+class ItemCache:
+    """
+    Bounded LRU cache of parsed shell items keyed by the raw bytes a target
+    can read, its ItemID and the two bytes after it, the code page and the
+    representation of times.
+    `hits` and `misses` count the lookups.
+
+    The cached targets are shared by every file which contains the same item,
+    they must be treated as read-only. They are decoded on their own, so they
+    keep no reference to the parsed input. Every field and extension block is
+    decoded on admission, see `LnkTargetBase.decode`, and only items which
+    decode without any anomaly are cached. The others are parsed again every
+    time with the caller's sink, as are items which fail to decode, so their
+    anomalies are reported when the fields are read, as without a cache.
+
+    A cache can be shared by threads, e.g. by `aparse_many` running on the
+    loop's default executor. Items are decoded outside of the lock, so two
+    threads may decode the same new item at once.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = 0
+
+    def target(self, target_class, binary, cp, diagnostics, timestamps="datetime"):
+        """
+        Return the parsed target of `binary`, the same view of the ItemID an
+        uncached target gets, creating it with `target_class` when it is not
+        cached yet.
+        """
+        key = (bytes(binary), cp, timestamps)
+        with self._lock:
+            target = self._items.get(key)
+            if target is not None:
+                self.hits += 1
+                self._items.move_to_end(key)
+                return target
+            self.misses += 1
+
+        sink = Diagnostics()
+        target = target_class(indata=key[0], cp=cp, diagnostics=sink, timestamps=timestamps)
+        try:
+            # Decode every field and extension block now, so a shared item
+            # never reports to the private sink later.
+            target.decode()
+        except Exception:
+            # Left to fail where an uncached target would, e.g. a KeyError is
+            # reported by `LnkTargets.as_list` with the caller's sink.
+            return target_class(
+                indata=key[0], cp=cp, diagnostics=diagnostics, timestamps=timestamps
+            )
+
+        if sink:
+            # Not shared, the caller gets its own target which reports the
+            # anomalies when and if the fields are read, as uncached.
+            return target_class(
+                indata=key[0], cp=cp, diagnostics=diagnostics, timestamps=timestamps
+            )
+
+        with self._lock:
+            self._items[key] = target
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return target
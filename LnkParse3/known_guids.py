@@ -0,0 +1,78 @@
+"""
+Names of well-known GUIDs found in shell items and extra data blocks: shell
+folder CLSIDs and KNOWNFOLDERIDs.
+
+Sources:
+    https://learn.microsoft.com/en-us/windows/win32/shell/knownfolderid
+    https://strontic.github.io/xcyclopedia/library/
+"""
+
+KNOWN_GUIDS = {
+    # Shell folder CLSIDs
+    "00021401-0000-0000-C000-000000000046": "Shell Link",
+    "018D5C66-4533-4307-9B53-224DE2ED1FE6": "OneDrive",
+    "031E4825-7B94-4DC3-B131-E946B44C8DD5": "UsersLibraries",
+    "208D2C60-3AEA-1069-A2D7-08002B30309D": "My Network Places",
+    "20D04FE0-3AEA-1069-A2D8-08002B30309D": "My Computer",
+    "21EC2020-3AEA-1069-A2DD-08002B30309D": "Control Panel Items",
+    "2227A280-3AEA-1069-A2DE-08002B30309D": "Printers",
+    "26EE0668-A00A-44D7-9371-BEB064C98683": "Control Panel",
+    "4234D49B-0245-4DF3-B780-3893943456E1": "Applications",
+    "450D8FBA-AD25-11D0-98A8-0800361B1103": "My Documents",
+    "59031A47-3F72-44A7-89C5-5595FE6B30EE": "Users Files",
+    "645FF040-5081-101B-9F08-00AA002F954E": "Recycle Bin",
+    "679F85CB-0220-4080-B29B-5540CC05AAB6": "Quick Access",
+    "871C5380-42A0-1069-A2EA-08002B30309D": "Internet Explorer",
+    "F02C1A0D-BE21-4350-88B0-7367FC96EF3C": "Network",
+    # KNOWNFOLDERIDs
+    "0139D44E-6AFE-49F2-8690-3DAFCAE6FFB8": "CommonPrograms",
+    "0762D272-C50A-4BB0-A382-697DCD729B80": "UserProfiles",
+    "18989B1D-99B5-455B-841C-AB7C74E4DDFC": "Videos",
+    "1777F761-68AD-4D8A-87BD-30B759FA33DD": "Favorites",
+    "1AC14E77-02E7-4E5D-B744-2EB1AE5198B7": "System",
+    "1E87508D-89C2-42F0-8A7E-645A0F50CA58": "AppsFolder",
+    "2400183A-6185-49FB-A2D8-4A392A602BA3": "PublicVideos",
+    "2B0F765D-C0E9-4171-908E-08A611B84FF6": "Cookies",
+    "3214FAB5-9757-4298-BB61-92A9DEAA44FF": "PublicMusic",
+    "33E28130-4E1E-4676-835A-98395C3BC3BB": "Pictures",
+    "352481E8-33BE-4251-BA85-6007CAEDCF9D": "InternetCache",
+    "374DE290-123F-4565-9164-39C4925E467B": "Downloads",
+    "3D644C9B-1FB8-4F30-9B45-F670235F79C0": "PublicDownloads",
+    "3EB685DB-65F9-4CF6-A03A-E3EF65729F3D": "RoamingAppData",
+    "4BD8D571-6D19-48D3-BE97-422220080E43": "Music",
+    "4C5C32FF-BB9D-43B0-B5B4-2D72E54EAAA4": "SavedGames",
+    "56784854-C6CB-462B-8169-88E350ACB882": "Contacts",
+    "5CD7AEE2-2219-4A67-B85D-6C9CE15660CB": "UserProgramFiles",
+    "5E6C858F-0E22-4760-9AFE-EA3317B67173": "Profile",
+    "625B53C3-AB48-4EC1-BA1F-A1EF4146FC19": "StartMenu",
+    "62AB5D82-FDC1-4DC3-A9DD-070D1D495D97": "ProgramData",
+    "6D809377-6AF0-444B-8957-A3773F02200E": "ProgramFilesX64",
+    "724EF170-A42D-4FEF-9F26-B60E846FBA4F": "AdminTools",
+    "7C5A40EF-A0FB-4BFC-874A-C0F2E0B9FA8E": "ProgramFilesX86",
+    "7D1D3A04-DEBB-4115-95CF-2F29DA2920DA": "SavedSearches",
+    "82A5EA35-D9CD-47C5-9629-E15D2F714E6E": "CommonStartup",
+    "8983036C-27C0-404B-8F08-102D10DCFD74": "SendTo",
+    "8AD10C31-2ADB-4296-A8F7-E4701232C972": "ResourceDir",
+    "905E63B6-C1BF-494E-B29C-65B732D3D21A": "ProgramFiles",
+    "9E3995AB-1F9C-4F13-B827-48B24B6C7174": "UserPinned",
+    "A4115719-D62E-491D-AA7C-E74B8BE3B067": "CommonStartMenu",
+    "A520A1A4-1780-4FF6-BD18-167343C5AF16": "LocalAppDataLow",
+    "A52BBA46-E9E1-435F-B3D9-28DAA648C0F6": "SkyDrive",
+    "A63293E8-664E-48DB-A079-DF759E0509F7": "Templates",
+    "A77F5D77-2E2B-44C3-A6A2-ABA601054A51": "Programs",
+    "AE50C081-EBD2-438A-8655-8A092E34987A": "Recent",
+    "B4BFCC3A-DB2C-424C-B029-7FE99A87C641": "Desktop",
+    "B6EBFB86-6907-413C-9AF7-4FC2ABF07CC5": "PublicPictures",
+    "B97D20BB-F46A-4C97-BA10-5E3608430854": "Startup",
+    "BFB9D5E0-C6A9-404C-B2B2-AE6DB6AF4968": "Links",
+    "C4AA340D-F20F-4863-AFEF-F87EF2E6BA25": "PublicDesktop",
+    "D65231B0-B2F1-4857-A4CE-A8E7C6EA7D27": "SystemX86",
+    "D9DC8A3B-B784-432E-A781-5A1130A75963": "History",
+    "DE974D24-D9C6-4D3E-BF91-F4455120B917": "ProgramFilesCommonX86",
+    "DFDF76A2-C82A-4D63-906A-5644AC457385": "Public",
+    "ED4824AF-DCE4-45A8-81E2-FC7965083634": "PublicDocuments",
+    "F1B32785-6FBA-4FCF-9D55-7B8E7F157091": "LocalAppData",
+    "F38BF404-1D43-42F2-9305-67DE0B28FC23": "Windows",
+    "F7F1ED05-9F6D-47A2-AAAE-29D317C6F066": "ProgramFilesCommon",
+    "FDD39AD0-238F-46AF-ADB4-6C85480369C7": "Documents",
+}
@@ -5,98 +5,286 @@ __author__ = "Matmaus"
 __version__ = "1.6.0"
 
 import argparse
-import datetime
+import functools
 import json
+import mmap as mmap_module
+import os
 import re
+import struct
+import sys
 import textwrap
+from struct import Struct
 from subprocess import list2cmdline
 
 import yaml
 
+from LnkParse3.decorators import VALIDATION_LEVELS
+from LnkParse3.diagnostics import Diagnostics
+from LnkParse3.diagnostics import WARNINGS
+from LnkParse3.exceptions import LnkParserError
 from LnkParse3.extra_data import ExtraData
 from LnkParse3.info_factory import InfoFactory
+from LnkParse3.lnk_header import LinkFlags
 from LnkParse3.lnk_header import LnkHeader
 from LnkParse3.lnk_info import LnkInfo
 from LnkParse3.lnk_targets import LnkTargets
+from LnkParse3.ndjson import datetime_to_str
+from LnkParse3.ndjson import NDJSONWriter
 from LnkParse3.string_data import StringData
+from LnkParse3.text_processor import TextProcessor
+from LnkParse3.utils import filetime_to_epoch_ns
+
+
+_UINT16 = Struct("<H")
+_UINT32 = Struct("<I")
 
 
 class LnkFile:
-    def __init__(self, fhandle=None, indata=None, cp=None, allow_terminal_blocks=True):
+    SECTIONS = ("header", "targets", "info", "string_data", "extras")
+    # Sections needed to build `lnk_command`
+    TARGET_SECTIONS = frozenset({"header", "string_data"})
+    # Sections needed to build `target_path`
+    PATH_SECTIONS = frozenset({"header", "targets", "info"})
+    # Representations of the times in `get_json` and of the time accessors
+    # of shell items and extra data. "raw" keeps FILETIMEs and DOS date/times
+    # as stored, "epoch_ns" converts them to Unix nanoseconds.
+    TIMESTAMPS = ("datetime", "raw", "epoch_ns")
+
+    def __init__(
+        self,
+        fhandle=None,
+        indata=None,
+        cp=None,
+        allow_terminal_blocks=True,
+        lazy=False,
+        sections=None,
+        diagnostics=True,
+        timestamps="datetime",
+        validation="warn",
+        item_cache=None,
+    ):
         if fhandle:
             self.indata = fhandle.read()
-        elif indata:
+        elif indata is not None:
             self.indata = indata
 
         self.cp = cp
         self.allow_terminal_blocks = allow_terminal_blocks
+        # Only record where the sections are, decode values on first access.
+        self.lazy = lazy
+
+        # Parse anomalies are collected here instead of being emitted as
+        # warnings. `False` drops them, a `Diagnostics` instance can be shared
+        # by many files.
+        if isinstance(diagnostics, Diagnostics):
+            self.diagnostics = diagnostics
+        else:
+            self.diagnostics = Diagnostics(enabled=diagnostics)
+
+        # Sections which are not requested are skipped by their size fields
+        # and left as `None`. The header is always parsed.
+        self.sections = set(self.SECTIONS if sections is None else sections) | {"header"}
+        unknown = self.sections.difference(self.SECTIONS)
+        if unknown:
+            raise LnkParserError(
+                "Unknown `LnkFile` sections %s, expected some of %s"
+                % (sorted(unknown), list(self.SECTIONS))
+            )
+
+        # Fields with a mandated value are checked once when they are decoded,
+        # see `decorators.validate`.
+        if validation not in VALIDATION_LEVELS:
+            raise LnkParserError(
+                "Unknown `LnkFile` validation %r, expected one of %s"
+                % (validation, list(VALIDATION_LEVELS))
+            )
+        self.validation = validation
+
+        # "raw" keeps the FILETIME and DOS date/time integers and "epoch_ns"
+        # converts them to Unix nanoseconds, neither creates `datetime`
+        # objects. It is passed down to shell items and extra data.
+        self.timestamps = self._check_timestamps(timestamps)
+
+        # An `ItemCache` shared by many files reuses their identical shell
+        # items, e.g. the My Computer root, instead of parsing them again.
+        self.item_cache = item_cache
+
+        # One decoder context for the whole parse, passed down the tree with
+        # the sink. Codecs are looked up once per code page and process.
+        self.text_processor = TextProcessor(cp=cp, diagnostics=self.diagnostics)
 
         self.process()
 
+    @classmethod
+    def from_path(cls, path, mmap=False, **kwargs):
+        """
+        Parse the file at `path`. With `mmap`, the file is memory-mapped and
+        parsed in place instead of being read into memory, so only the pages
+        which are actually touched are loaded and the page cache is shared
+        with other processes reading the same file. The mapping lives as long
+        as the returned object.
+        """
+        return cls(indata=cls.read_path(path, mmap), **kwargs)
+
+    @staticmethod
+    def read_path(path, mmap=False):
+        """
+        Return the content of the file at `path`, memory-mapped with `mmap`,
+        e.g. for `shortcut_target`. See `from_path`.
+        """
+        with open(path, "rb") as fhandle:
+            # An empty file cannot be mapped.
+            if mmap and os.fstat(fhandle.fileno()).st_size:
+                return mmap_module.mmap(fhandle.fileno(), 0, access=mmap_module.ACCESS_READ)
+            return fhandle.read()
+
+    def _check_timestamps(self, timestamps):
+        if timestamps not in self.TIMESTAMPS:
+            raise LnkParserError(
+                "Unknown `LnkFile` timestamps %r, expected one of %s"
+                % (timestamps, list(self.TIMESTAMPS))
+            )
+        return timestamps
+
+    def _with_timestamps(self, timestamps):
+        # Times of shell items and extra data are decoded with their
+        # structures, so they need a parse of their own.
+        return type(self)(
+            indata=self.indata,
+            cp=self.cp,
+            allow_terminal_blocks=self.allow_terminal_blocks,
+            lazy=True,
+            sections=self.sections,
+            diagnostics=False,
+            timestamps=timestamps,
+            validation="off",
+        )
+
+    def _header_times(self, timestamps):
+        header = self.header
+        if timestamps == "datetime":
+            return header.creation_time(), header.access_time(), header.write_time()
+
+        raw = header.raw_creation_time(), header.raw_access_time(), header.raw_write_time()
+        if timestamps == "raw":
+            return raw
+        return tuple(filetime_to_epoch_ns(filetime) for filetime in raw)
+
     def has_relative_path(self):
-        return bool("HasRelativePath" in self.header.link_flags())
+        return self.header.has_link_flag(LinkFlags.HAS_RELATIVE_PATH)
 
     def has_arguments(self):
-        return bool("HasArguments" in self.header.link_flags())
+        return self.header.has_link_flag(LinkFlags.HAS_ARGUMENTS)
 
     def is_unicode(self):
-        return bool("IsUnicode" in self.header.link_flags())
+        return self.header.has_link_flag(LinkFlags.IS_UNICODE)
 
     def has_name(self):
-        return bool("HasName" in self.header.link_flags())
+        return self.header.has_link_flag(LinkFlags.HAS_NAME)
 
     def has_working_dir(self):
-        return bool("HasWorkingDir" in self.header.link_flags())
+        return self.header.has_link_flag(LinkFlags.HAS_WORKING_DIR)
 
     def has_icon_location(self):
-        return bool("HasIconLocation" in self.header.link_flags())
+        return self.header.has_link_flag(LinkFlags.HAS_ICON_LOCATION)
 
     def has_target_id_list(self):
-        return bool("HasTargetIDList" in self.header.link_flags())
+        return self.header.has_link_flag(LinkFlags.HAS_TARGET_ID_LIST)
 
     def has_link_info(self):
-        return bool("HasLinkInfo" in self.header.link_flags())
+        return self.header.has_link_flag(LinkFlags.HAS_LINK_INFO)
 
     def force_no_link_info(self):
-        return bool("ForceNoLinkInfo" in self.header.link_flags())
+        return self.header.has_link_flag(LinkFlags.FORCE_NO_LINK_INFO)
 
     def process(self):
         index = 0
 
+        # All sections share one zero-copy view of the input, slicing it only
+        # moves the cursor, no bytes are copied until a value is decoded.
+        data = memoryview(self.indata)
+
         # Parse header
-        self.header = LnkHeader(indata=self.indata)
+        self.header = LnkHeader(
+            indata=data, diagnostics=self.diagnostics, validation=self.validation
+        )
         index += self.header.size()
+        self.section_index = {"header": (0, index)}
 
         # XXX: json
         self._target_index = index + 2
 
         # Parse ID List
         self.targets = None
+        targets = None
         if self.has_target_id_list():
-            self.targets = LnkTargets(indata=self.indata[index:], cp=self.cp)
-            index += self.targets.size()
+            targets = LnkTargets(
+                indata=data[index:],
+                cp=self.cp,
+                diagnostics=self.diagnostics,
+                item_cache=self.item_cache,
+                text_processor=self.text_processor,
+                timestamps=self.timestamps,
+            )
+            if "targets" in self.sections:
+                self.targets = targets
+            self.section_index["targets"] = (index, targets.size())
+            index += targets.size()
 
         # Parse Link Info
         self.info = None
         if self.has_link_info() and not self.force_no_link_info():
-            info = LnkInfo(indata=self.indata[index:], cp=self.cp)
+            info = LnkInfo(
+                indata=data[index:],
+                cp=self.cp,
+                diagnostics=self.diagnostics,
+                text_processor=self.text_processor,
+            )
             info_class = InfoFactory(info).info_class()
             if info_class:
-                self.info = info_class(indata=self.indata[index:], cp=self.cp)
-                index += self.info.size()
+                if "info" in self.sections:
+                    self.info = info_class(
+                        indata=data[index:],
+                        cp=self.cp,
+                        diagnostics=self.diagnostics,
+                        text_processor=self.text_processor,
+                    )
+                self.section_index["info"] = (index, info.size())
+                index += info.size()
 
         # Parse String Data
-        self.string_data = StringData(self, indata=self.indata[index:], cp=self.cp)
-        index += self.string_data.size()
+        wanted = "string_data" in self.sections
+        string_data = StringData(
+            self,
+            indata=data[index:],
+            cp=self.cp,
+            lazy=self.lazy or not wanted,
+            diagnostics=self.diagnostics,
+            text_processor=self.text_processor,
+        )
+        self.string_data = string_data if wanted else None
+        self.section_index["string_data"] = (index, string_data.size())
+        index += string_data.size()
 
         # Parse Extra Data
-        self.extras = ExtraData(
-            indata=self.indata[index:], cp=self.cp, allow_terminal_blocks=self.allow_terminal_blocks
+        wanted = "extras" in self.sections
+        extras = ExtraData(
+            indata=data[index:],
+            cp=self.cp,
+            allow_terminal_blocks=self.allow_terminal_blocks,
+            lazy=self.lazy or not wanted,
+            diagnostics=self.diagnostics,
+            validation=self.validation,
+            link_targets=targets,
+            text_processor=self.text_processor,
+            timestamps=self.timestamps,
         )
-        index += self.extras.size()
+        self.extras = extras if wanted else None
+        self.section_index["extras"] = (index, extras.size())
+        index += extras.size()
 
         # Add size of the footer if present
-        index += min(len(self.indata[index:]), 4)
+        index += min(len(data[index:]), 4)
 
         # Final LNK size
         self.size = index
@@ -170,42 +358,61 @@ class LnkFile:
 
         return " ".join(out)
 
-    def print_shortcut_target(self, pjson=False):
-        out = self.lnk_command
+    def target_path(self):
+        """
+        Full path of the link target from `LocalBasePath` and
+        `CommonPathSuffix` of the link info, or joined from the IDList when
+        there is no local path. `None` when neither is present or parsed.
+        """
+        if self.info is not None:
+            base = self.info.local_base_path_unicode() or self.info.local_base_path()
+            if base:
+                suffix = (
+                    self.info.common_path_suffix_unicode() or self.info.common_path_suffix() or ""
+                )
+                return base + suffix
 
-        if pjson:
-            print(json.dumps({"shortcut_target": out}))
-        else:
-            print(out)
+        if self.targets is not None:
+            return self.targets.path()
+        return None
+
+    def print_shortcut_target(self, pjson=False):
+        _print_shortcut_target(self.lnk_command, pjson)
 
     def print_json(self, print_all=False):
         res = self.get_json(print_all)
 
-        def _datetime_to_str(obj):
-            if isinstance(obj, datetime.datetime):
-                return obj.replace(microsecond=0).isoformat()
-            return obj
-
         print(
             json.dumps(
                 res,
                 indent=4,
                 separators=(",", ": "),
-                default=_datetime_to_str,
+                default=datetime_to_str,
                 sort_keys=True,
             )
         )
 
-    def get_json(self, get_all=False):
+    def get_json(self, get_all=False, timestamps=None):
+        """
+        Return the parsed file as a dictionary. `timestamps` overrides the
+        representation of all times, see `TIMESTAMPS`. A representation other
+        than the one of the parse decodes the file again, its anomalies are
+        not collected a second time.
+        """
+        timestamps = self._check_timestamps(timestamps or self.timestamps)
+        if timestamps != self.timestamps:
+            return self._with_timestamps(timestamps).get_json(get_all)
+
+        creation_time, access_time, write_time = self._header_times(timestamps)
         res = {
             "size": self.size,
             "header": {
                 "guid": self.header.link_cls_id(),
                 "r_link_flags": self.header.r_link_flags(),
                 "r_file_flags": self.header.r_file_flags(),
-                "creation_time": self.header.creation_time(),
-                "accessed_time": self.header.access_time(),
-                "modified_time": self.header.write_time(),
+                "creation_time": creation_time,
+                "accessed_time": access_time,
+                "modified_time": write_time,
                 "file_size": self.header.file_size(),
                 "icon_index": self.header.icon_index(),
                 "windowstyle": self.header.window_style(),
@@ -312,8 +519,10 @@ class LnkFile:
                 if self.info.device_name():
                     res["link_info"]["location_info"]["device_name"] = self.info.device_name()
 
-        res["data"] = self.string_data.as_dict()
-        res["extra"] = self.extras.as_dict()
+        if self.string_data is not None:
+            res["data"] = self.string_data.as_dict()
+        if self.extras is not None:
+            res["extra"] = self.extras.as_dict()
 
         if not get_all:
             res["header"].pop("header_size", None)
@@ -345,13 +554,133 @@ class LnkFile:
         return res
 
 
+def _print_shortcut_target(out, pjson=False):
+    if pjson:
+        print(json.dumps({"shortcut_target": out}))
+    else:
+        print(out)
+
+
+# Size of the whole ShellLinkHeader record, see `LnkHeader`
+_HEADER_SIZE = 0x4C
+# StringData fields up to the arguments and whether their length is limited
+# to 260 characters, see `StringData.FIELDS`
+_TARGET_STRINGS = (
+    (LinkFlags.HAS_NAME, True),
+    (LinkFlags.HAS_RELATIVE_PATH, True),
+    (LinkFlags.HAS_WORKING_DIR, True),
+    (LinkFlags.HAS_ARGUMENTS, False),
+)
+
+
+@functools.cache
+def _silent_text_processor(cp):
+    # Anomalies are not collected, so one processor per code page will do.
+    return TextProcessor(cp=cp, diagnostics=Diagnostics(enabled=False))
+
+
+def _target_strings(data):
+    """
+    Return the link flags and the raw RelativePath and Arguments strings.
+    The ID list and the link info are skipped by their size fields, the
+    strings before the arguments are only measured and the extra data is
+    never reached. Raise `struct.error` on truncated structures.
+    """
+    if len(data) < _HEADER_SIZE:
+        raise struct.error("truncated header")
+    index = _UINT32.unpack_from(data, 0)[0]
+    link_flags = _UINT32.unpack_from(data, 20)[0]
+
+    if link_flags & LinkFlags.HAS_TARGET_ID_LIST:
+        index += _UINT16.unpack_from(data, index)[0] + 2
+
+    # As in `LnkFile.process`, the link info is skipped only when
+    # `InfoFactory` finds its class.
+    if (
+        link_flags & LinkFlags.HAS_LINK_INFO
+        and not link_flags & LinkFlags.FORCE_NO_LINK_INFO
+        and _UINT32.unpack_from(data, index + 8)[0] & 0x0003
+    ):
+        index += _UINT32.unpack_from(data, index)[0]
+
+    strings = {}
+    for flag, limit_length in _TARGET_STRINGS:
+        if link_flags & flag:
+            char_count = _UINT16.unpack_from(data, index)[0]
+            length = 260 if limit_length and char_count > 260 else char_count
+            if link_flags & LinkFlags.IS_UNICODE:
+                length *= 2
+            index += 2
+            strings[flag] = data[index : index + length]
+            index += length
+
+    return (
+        link_flags,
+        strings.get(LinkFlags.HAS_RELATIVE_PATH),
+        strings.get(LinkFlags.HAS_ARGUMENTS),
+    )
+
+
+def shortcut_target(fhandle=None, indata=None, cp=None):
+    """
+    Return the shortcut target (relative path and arguments) without parsing
+    the ID list, link info, the other strings and extra blocks. Only the two
+    needed strings are decoded, fields are not validated and parse anomalies
+    are not collected.
+    """
+    if fhandle:
+        indata = fhandle.read()
+
+    try:
+        link_flags, relative_path, arguments = _target_strings(memoryview(indata))
+    except (struct.error, TypeError):
+        # Truncated or missing input, fail or fall back as the full parser.
+        lnk = LnkFile(
+            indata=indata,
+            cp=cp,
+            lazy=True,
+            sections=LnkFile.TARGET_SECTIONS,
+            diagnostics=False,
+            validation="off",
+        )
+        return lnk.lnk_command
+
+    text_processor = _silent_text_processor(cp)
+    if link_flags & LinkFlags.IS_UNICODE:
+        decode = text_processor.read_unicode_string
+    else:
+        decode = text_processor.read_string
+
+    out = []
+    if relative_path is not None:
+        out.append(list2cmdline([decode(relative_path)]))
+    if arguments is not None:
+        out.append(decode(arguments))
+    return " ".join(out)
+
+
 def main():
     arg_parser = argparse.ArgumentParser(description=__description__)
     arg_parser.add_argument(
         dest="file",
         metavar="FILE",
+        nargs="?",
         help="absolute or relative path to the file",
     )
+    arg_parser.add_argument(
+        "-r",
+        "--recursive",
+        dest="directory",
+        metavar="DIR",
+        help="parse all LNK files under DIR, print one JSON record per line",
+    )
+    arg_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes for --recursive (default: number of CPUs)",
+    )
     arg_parser.add_argument(
         "-t", "--target", action="store_true", help="print shortcut target only"
     )
@@ -372,14 +701,36 @@ def main():
     )
     args = arg_parser.parse_args()
 
-    with open(args.file, "rb") as file:
-        lnk = LnkFile(fhandle=file, cp=args.cp)
-        if args.target:
-            lnk.print_shortcut_target(pjson=args.json)
-        elif args.json:
-            lnk.print_json(args.print_all)
-        else:
-            lnk.print_lnk_file(args.print_all)
+    if args.directory:
+        # Imported here, `batch` itself depends on this module.
+        from LnkParse3.batch import parse_tree
+
+        records = parse_tree(
+            args.directory,
+            workers=args.workers,
+            cp=args.cp,
+            print_all=args.print_all,
+            target_only=args.target,
+        )
+        NDJSONWriter(sys.stdout).write_all(records)
+        return
+
+    if not args.file:
+        arg_parser.error("the following arguments are required: FILE (or --recursive DIR)")
+
+    if args.target:
+        indata = LnkFile.read_path(args.file, mmap=True)
+        _print_shortcut_target(shortcut_target(indata=indata, cp=args.cp), pjson=args.json)
+        return
+
+    # Report parse anomalies on stderr as they are found.
+    open_lnk = functools.partial(
+        LnkFile.from_path, args.file, mmap=True, cp=args.cp, diagnostics=WARNINGS
+    )
+    if args.json:
+        open_lnk().print_json(args.print_all)
+    else:
+        open_lnk().print_lnk_file(args.print_all)
 
 
 if __name__ == "__main__":
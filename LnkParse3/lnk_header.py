@@ -1,8 +1,13 @@
-from struct import unpack
+import struct
+from enum import IntFlag
+from struct import Struct
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.decorators import filetime
 from LnkParse3.decorators import must_be
 from LnkParse3.decorators import uuid
+from LnkParse3.decorators import validate
+from LnkParse3.diagnostics import WARNINGS
 from LnkParse3.exceptions import LnkParserError
 
 
@@ -48,6 +53,82 @@ structures.
 """
 
 
+class LinkFlags(IntFlag):
+    # fmt: off
+    HAS_TARGET_ID_LIST = 0x00000001
+    HAS_LINK_INFO = 0x00000002
+    HAS_NAME = 0x00000004
+    HAS_RELATIVE_PATH = 0x00000008
+    HAS_WORKING_DIR = 0x00000010
+    HAS_ARGUMENTS = 0x00000020
+    HAS_ICON_LOCATION = 0x00000040
+    IS_UNICODE = 0x00000080
+    FORCE_NO_LINK_INFO = 0x00000100
+    HAS_EXP_STRING = 0x00000200
+    RUN_IN_SEPARATE_PROCESS = 0x00000400
+    RESERVED0 = 0x00000800
+    HAS_DARWIN_ID = 0x00001000
+    RUN_AS_USER = 0x00002000
+    HAS_EXP_ICON = 0x00004000
+    NO_PIDL_ALIAS = 0x00008000
+    RESERVED1 = 0x00010000
+    RUN_WITH_SHIM_LAYER = 0x00020000
+    FORCE_NO_LINK_TRACK = 0x00040000
+    ENABLE_TARGET_METADATA = 0x00080000
+    DISABLE_LINK_PATH_TRACKING = 0x00100000
+    DISABLE_KNOWN_FOLDER_TRACKING = 0x00200000
+    DISABLE_KNOWN_FOLDER_ALIAS = 0x00400000
+    ALLOW_LINK_TO_LINK = 0x00800000
+    UNALIAS_ON_SAVE = 0x01000000
+    PREFER_ENVIRONMENT_PATH = 0x02000000
+    KEEP_LOCAL_ID_LIST_FOR_UNC_TARGET = 0x04000000
+    # fmt: on
+
+
+class _HeaderRecord:
+    """
+    All fixed-size fields of the ShellLinkHeader decoded by a single
+    `unpack_from` call.
+    """
+
+    STRUCT = Struct("<I16sII8s8s8sIii2sHII")
+
+    __slots__ = (
+        "access_time",
+        "creation_time",
+        "file_flags",
+        "file_size",
+        "hot_key",
+        "icon_index",
+        "link_cls_id",
+        "link_flags",
+        "reserved0",
+        "reserved1",
+        "reserved2",
+        "show_command",
+        "size",
+        "write_time",
+    )
+
+    def __init__(self, binary):
+        (
+            self.size,
+            self.link_cls_id,
+            self.link_flags,
+            self.file_flags,
+            self.creation_time,
+            self.access_time,
+            self.write_time,
+            self.file_size,
+            self.icon_index,
+            self.show_command,
+            self.hot_key,
+            self.reserved0,
+            self.reserved1,
+            self.reserved2,
+        ) = self.STRUCT.unpack_from(binary)
+
+
 class LnkHeader:
     # https://docs.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-showwindow
     WINDOW_STYLES = {
@@ -286,7 +367,14 @@ class LnkHeader:
         0x00020000: "FILE_ATTRIBUTE_NO_SCRUB_DATA",
     }  # }}}
 
-    def __init__(self, fhandle=None, indata=None):
+    _LINK_FLAG_ITEMS = tuple(sorted(LINK_FLAG_MASK.items()))
+    _FILE_FLAG_ITEMS = tuple(sorted(FILE_FLAG_MASK.items()))
+
+    # The accessors always return `datetime`, `LnkFile` converts the raw
+    # values for other representations.
+    timestamps = "datetime"
+
+    def __init__(self, fhandle=None, indata=None, diagnostics=WARNINGS, validation="warn"):
         if fhandle:
             self._raw = fhandle.read()
         elif indata:
@@ -295,11 +383,16 @@ class LnkHeader:
             raise LnkParserError(
                 "Both `LnkHeader` arguments `fhandle` and `indata` are evalued as `None`"
             )
+        self.diagnostics = diagnostics
 
-        self._lnk_header = {}
-        self._stash = {}
+        try:
+            self._record = _HeaderRecord(self._raw)
+        except struct.error as e:
+            raise LnkParserError(f"Truncated `LnkHeader`: {e}") from e
 
-        self._raw = self._raw[: self.size()]
+        self._raw = self._raw[: self._record.size]
+
+        validate(self, validation)
 
     @must_be(int("0x0000004C", 16))
     def size(self):
@@ -307,18 +400,17 @@ class LnkHeader:
         The size, in bytes, of this structure.
         This value MUST be 0x0000004C.
         """
-        start, end = 0, 4
-        size = unpack("<I", self._raw[start:end])[0]
-        return size
+        return self._record.size
 
     @must_be("00021401-0000-0000-C000-000000000046")
+    @cached_field
     @uuid
     def link_cls_id(self):
         """LinkCLSID (16 bytes):
         A class identifier (CLSID).
         This value MUST be 00021401-0000-0000-C000-000000000046.
         """
-        return self._raw[4:20]
+        return self._record.link_cls_id
 
     def guid(self):
         return self.link_cls_id()
@@ -328,9 +420,15 @@ class LnkHeader:
         A LinkFlags structure (section 2.1.1) that specifies information about
         the shell link and the presence of optional portions of the structure.
         """
-        start, end = 20, 24
-        flags = unpack("<I", self._raw[start:end])[0]
-        return flags
+        return self._record.link_flags
+
+    def has_link_flag(self, flag):
+        """
+        Test a single `LinkFlags` bit without building the list of names.
+        """
+        # `int.__and__` keeps the test on plain integers, `&` with an IntFlag
+        # operand would create a new flag object on every call.
+        return int.__and__(self._record.link_flags, flag) != 0
 
     def link_flags(self):
         """
@@ -338,18 +436,15 @@ class LnkHeader:
         structures are present in the file format after the ShellLinkHeader
         structure (section 2.1).
         """
-        items = sorted(self.LINK_FLAG_MASK.items())
-        flag = self.r_link_flags()
-        return [key for mask, key in items if bool(flag & mask)]
+        flag = self._record.link_flags
+        return [key for mask, key in self._LINK_FLAG_ITEMS if flag & mask]
 
     def r_file_flags(self):
         """FileAttributes (4 bytes):
         A FileAttributesFlags structure (section 2.1.2) that specifies
         information about the link target.
         """
-        start, end = 24, 28
-        flags = unpack("<I", self._raw[start:end])[0]
-        return flags
+        return self._record.file_flags
 
     def file_flags(self):
         """
@@ -359,10 +454,10 @@ class LnkHeader:
         accessing the target would be inefficient. It is possible for the
         target items attributes to be out of sync with this value.
         """
-        items = sorted(self.FILE_FLAG_MASK.items())
-        flag = self.r_file_flags()
-        return [key for mask, key in items if bool(flag & mask)]
+        flag = self._record.file_flags
+        return [key for mask, key in self._FILE_FLAG_ITEMS if flag & mask]
 
+    @cached_field
     @filetime
     def creation_time(self):
         """CreationTime (8 bytes):
@@ -370,9 +465,9 @@ class LnkHeader:
         creation time of the link target in UTC (Coordinated Universal Time).
         If the value is zero, there is no creation time set on the link target.
         """
-        start, end = 28, 36
-        return self._raw[start:end]
+        return self._record.creation_time
 
+    @cached_field
     @filetime
     def access_time(self):
         """AccessTime (8 bytes):
@@ -380,9 +475,9 @@ class LnkHeader:
         access time of the link target in UTC (Coordinated Universal Time). If
         the value is zero, there is no access time set on the link target.
         """
-        start, end = 36, 44
-        return self._raw[start:end]
+        return self._record.access_time
 
+    @cached_field
     @filetime
     def write_time(self):
         """WriteTime (8 bytes):
@@ -390,8 +485,19 @@ class LnkHeader:
         time of the link target in UTC (Coordinated Universal Time). If the
         value is zero, there is no write time set on the link target.
         """
-        start, end = 44, 52
-        return self._raw[start:end]
+        return self._record.write_time
+
+    def raw_creation_time(self):
+        """
+        CreationTime as the raw FILETIME integer, no `datetime` is created.
+        """
+        return int.from_bytes(self._record.creation_time, "little", signed=True)
+
+    def raw_access_time(self):
+        return int.from_bytes(self._record.access_time, "little", signed=True)
+
+    def raw_write_time(self):
+        return int.from_bytes(self._record.write_time, "little", signed=True)
 
     def file_size(self):
         """FileSize (4 bytes):
@@ -400,20 +506,17 @@ class LnkHeader:
         value specifies the least significant 32 bits of the link target file
         size.
         """
-        start, end = 52, 56
-        size = unpack("<I", self._raw[start:end])[0]
-        return size
+        return self._record.file_size
 
     def icon_index(self):
         """IconIndex (4 bytes):
         A 32-bit signed integer that specifies the index of an icon within
         a given icon location.
         """
-        start, end = 56, 60
-        index = unpack("<i", self._raw[start:end])[0]
-        return index
+        return self._record.icon_index
 
     # TODO: rename to show_command
+    @cached_field
     def window_style(self):
         """ShowCommand (4 bytes):
         A 32-bit unsigned integer that specifies the expected window state of
@@ -433,16 +536,15 @@ class LnkHeader:
 
         All other values MUST be treated as SW_SHOWNORMAL.
         """
-        start, end = 60, 64
-        style = unpack("<i", self._raw[start:end])[0]
+        style = self._record.show_command
         fallback = self.WINDOW_STYLES[1]
         return self.WINDOW_STYLES.get(style, fallback)
 
     # TODO: See _raw_hot_key
+    @cached_field
     def hot_key(self):
-        start, end = 64, 66
-        hot_key = self._raw[start:end]
-        b_low, b_high = unpack("<cc", hot_key)
+        hot_key = self._record.hot_key
+        b_low, b_high = hot_key[0:1], hot_key[1:2]
 
         high = self.HOTKEY_VALUES_HIGH.get(b_high)
         low = self.HOTKEY_VALUES_LOW.get(b_low)
@@ -458,9 +560,7 @@ class LnkHeader:
         value is assigned to the application after it is launched, so that
         pressing the key activates that application.
         """
-        start, end = 64, 66
-        raw = unpack("<H", self._raw[start:end])[0]
-        return raw
+        return int.from_bytes(self._record.hot_key, "little")
 
     # TODO: rename to reserved1
     @must_be(0)
@@ -468,9 +568,7 @@ class LnkHeader:
         """Reserved1 (2 bytes):
         A value that MUST be zero.
         """
-        start, end = 66, 68
-        raw = unpack("<H", self._raw[start:end])[0]
-        return raw
+        return self._record.reserved0
 
     # TODO: rename to reserved2
     @must_be(0)
@@ -478,10 +576,7 @@ class LnkHeader:
         """Reserved2 (4 bytes):
         A value that MUST be zero.
         """
-        start, end = 68, 72
-        raw = unpack("<I", self._raw[start:end])[0]
-
-        return raw
+        return self._record.reserved1
 
     # TODO: rename to reserved3
     @must_be(0)
@@ -489,7 +584,4 @@ class LnkHeader:
         """Reserved3 (4 bytes):
         A value that MUST be zero.
         """
-        start, end = 72, 76
-        raw = unpack("<I", self._raw[start:end])[0]
-
-        return raw
+        return self._record.reserved2
@@ -1,6 +1,8 @@
 from struct import unpack
 
-from LnkParse3.text_processor import TextProcessor
+from LnkParse3.decorators import cached_field
+from LnkParse3.diagnostics import WARNINGS
+from LnkParse3.text_processor import get_text_processor
 
 
 """
@@ -53,10 +55,12 @@ ShellLinkHeader.
 
 
 class LnkInfo:
-    def __init__(self, indata=None, cp=None):
+    def __init__(self, indata=None, cp=None, diagnostics=WARNINGS, text_processor=None):
         self._raw = indata
-        self.text_processor = TextProcessor(cp=cp)
+        self.diagnostics = diagnostics
+        self.text_processor = text_processor or get_text_processor(cp, diagnostics)
 
+    @cached_field
     def size(self):
         """LinkInfoSize (4 bytes):
         A 32-bit, unsigned integer that specifies the size, in bytes, of the
@@ -67,6 +71,7 @@ class LnkInfo:
         start, end = 0, 4
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def header_size(self):
         """LinkInfoHeaderSize (4 bytes):
         A 32-bit, unsigned integer that specifies the size, in bytes, of the
@@ -85,6 +90,7 @@ class LnkInfo:
         start, end = 4, 8
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def flags(self):
         """LinkInfoFlags (4 bytes):
         Flags that specify whether the VolumeID, LocalBasePath,
@@ -94,6 +100,7 @@ class LnkInfo:
         start, end = 8, 12
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def volume_id_offset(self):
         """VolumeIDOffset (4 bytes):
         A 32-bit, unsigned integer that specifies the location of the VolumeID
@@ -104,6 +111,7 @@ class LnkInfo:
         start, end = 12, 16
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def local_base_path_offset(self):
         """LocalBasePathOffset (4 bytes):
         A 32-bit, unsigned integer that specifies the location of the
@@ -114,6 +122,7 @@ class LnkInfo:
         start, end = 16, 20
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def common_network_relative_link_offset(self):
         """CommonNetworkRelativeLinkOffset (4 bytes):
         A 32-bit, unsigned integer that specifies the location of the
@@ -125,6 +134,7 @@ class LnkInfo:
         start, end = 20, 24
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def common_path_suffix_offset(self):
         """CommonPathSuffixOffset (4 bytes):
         A 32-bit, unsigned integer that specifies the location of the
@@ -134,12 +144,14 @@ class LnkInfo:
         start, end = 24, 28
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def _has_opt_fields(self):
         """
         Offsets to the optional fields are specified.
         """
         return bool(self.header_size() >= 0x00000024)
 
+    @cached_field
     def common_path_suffix(self):
         """CommonPathSuffix (variable):
         A NULL-terminated string, defined by the system default code page,
@@ -155,6 +167,7 @@ class LnkInfo:
         text = self.text_processor.read_string(binary)
         return text
 
+    @cached_field
     def local_base_path_offset_unicode(self):
         """LocalBasePathOffsetUnicode (4 bytes):
         An optional, 32-bit, unsigned integer that specifies the location of
@@ -170,6 +183,7 @@ class LnkInfo:
         start, end = 28, 32
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def common_path_suffix_offset_unicode(self):
         """CommonPathSuffixOffsetUnicode (4 bytes):
         An optional, 32-bit, unsigned integer that specifies the location of
@@ -184,6 +198,7 @@ class LnkInfo:
         start, end = 32, 36
         return unpack("<I", self._raw[start:end])[0]
 
+    @cached_field
     def local_base_path(self):
         """LocalBasePath (variable):
         An optional, NULL-terminated string, defined by the system default
@@ -209,6 +224,7 @@ class LnkInfo:
         # TODO:
         pass
 
+    @cached_field
     def local_base_path_unicode(self):
         """LocalBasePathUnicode (variable):
         An optional, NULL-terminated, Unicode string that is used to construct
@@ -226,6 +242,7 @@ class LnkInfo:
         text = self.text_processor.read_unicode_string(binary)
         return text
 
+    @cached_field
     def common_path_suffix_unicode(self):
         """CommonPathSuffixUnicode (variable):
         An optional, NULL-terminated, Unicode string that is used to construct
@@ -1,6 +1,7 @@
-import warnings
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
+from LnkParse3.diagnostics import WARNINGS
 from LnkParse3.target_factory import TargetFactory
 
 
@@ -23,10 +24,22 @@ HasLinkTargetIDList bit (LinkFlags section 2.1.1) in the ShellLinkHeader.
 class LnkTargets:
     SIZE_OF_ID_LIST_SIZE = 2
 
-    def __init__(self, indata=None, cp=None):
-        self._targets = {}
+    def __init__(
+        self,
+        indata=None,
+        cp=None,
+        diagnostics=WARNINGS,
+        item_cache=None,
+        text_processor=None,
+        timestamps="datetime",
+    ):
         self.cp = cp
         self._raw = indata
+        self.diagnostics = diagnostics
+        self.item_cache = item_cache
+        # Passed down to the targets, `None` lets every target make its own.
+        self.text_processor = text_processor
+        self.timestamps = timestamps
 
         start = self.SIZE_OF_ID_LIST_SIZE
         end = self.size()
@@ -49,6 +62,12 @@ class LnkTargets:
         size = unpack("<H", self._raw[start:end])[0]
         return size
 
+    def raw_id_list(self):
+        """
+        Raw IDList including the TerminalID, without IDListSize.
+        """
+        return self._raw_targets
+
     def _id_lists(self):
         """ItemIDList (variable):
         An array of zero or more ItemID structures (section 2.2.2), which
@@ -67,20 +86,39 @@ class LnkTargets:
         |         TerminalID           |
         --------------------------------
         """
-        rest = self._raw_targets
-        while rest:
-            factory = TargetFactory(indata=rest)
-            target_class = factory.target_class()
-
-            if not target_class:
-                # Empty or unknown target object.
-                break
-
-            target = target_class(indata=rest, cp=self.cp)
-
-            size = factory.item_size()
-            rest = rest[size:]
-            yield target
+        return iter(self._targets())
+
+    @cached_field
+    def _targets(self):
+        # Scanned and constructed once, `as_list` and iteration reuse them.
+        return TargetFactory.targets(
+            self._raw_targets,
+            cp=self.cp,
+            diagnostics=self.diagnostics,
+            item_cache=self.item_cache,
+            text_processor=self.text_processor,
+            timestamps=self.timestamps,
+        )
+
+    @cached_field
+    def path(self):
+        """
+        Target path joined from the names of the items, e.g. `C:\\test\\a.txt`
+        for a volume item followed by two file entries, or `None` when no item
+        has a name.
+        """
+        path = None
+        for target in self._targets():
+            part = target.path_part()
+            if not part:
+                continue
+            if path is None:
+                path = part
+            elif path.endswith("\\"):
+                path += part
+            else:
+                path += "\\" + part
+        return path
 
     def as_list(self):
         res = []
@@ -88,7 +126,6 @@ class LnkTargets:
             try:
                 res.append(target.as_item())
             except KeyError as e:
-                msg = f"Error while parsing TargetID `{target.name}` (KeyError {e})"
-                warnings.warn(msg)
+                self.diagnostics.report("invalid-target", target.name, e)
                 continue
         return res
@@ -0,0 +1,65 @@
+"""
+Compact newline-delimited JSON (NDJSON) output for bulk parsing. Each record is
+encoded on a single line without indentation or key sorting and lines are
+written to one file handle in batches.
+"""
+
+import datetime
+import json
+import sys
+
+
+def datetime_to_str(obj):
+    if isinstance(obj, datetime.datetime):
+        return obj.replace(microsecond=0).isoformat()
+    return obj
+
+
+def json_ready(obj):
+    """
+    Return a copy of `obj` with all datetimes converted to strings, so it can
+    be encoded without the `default` callback, e.g. after crossing a process
+    boundary.
+    """
+    if isinstance(obj, dict):
+        return {key: json_ready(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [json_ready(value) for value in obj]
+    return datetime_to_str(obj)
+
+
+class NDJSONWriter:
+    # Number of records kept in memory before they are written out.
+    BUFFER_RECORDS = 256
+
+    def __init__(self, fhandle=None):
+        self._fhandle = fhandle if fhandle is not None else sys.stdout
+        self._buffer = []
+        self._encode = json.JSONEncoder(
+            separators=(",", ":"),
+            check_circular=False,
+            default=datetime_to_str,
+        ).encode
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+    def write(self, record):
+        self._buffer.append(self._encode(record))
+        if len(self._buffer) >= self.BUFFER_RECORDS:
+            self.flush()
+
+    def write_all(self, records):
+        for record in records:
+            self.write(record)
+        self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._buffer.append("")
+            self._fhandle.write("\n".join(self._buffer))
+            self._buffer = []
+        self._fhandle.flush()
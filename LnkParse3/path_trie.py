@@ -0,0 +1,124 @@
+"""
+Target paths of many LNK files stored as one trie of path components. Paths of
+a corpus share long prefixes, e.g. `C:\\Users\\<user>\\AppData`, every prefix is
+stored once and each file only needs to keep the integer ID of its node.
+"""
+
+import sys
+
+
+class PathTrie:
+    """
+    Trie of Windows paths. Nodes are kept in parallel lists and identified by
+    their index, node `0` is the root. Components are compared
+    case-insensitively, a node keeps the spelling it was first added with.
+    """
+
+    ROOT = 0
+    SEPARATOR = "\\"
+    # Pattern component matching any single path component
+    WILDCARD = "*"
+
+    def __init__(self):
+        self._parents = [None]
+        self._names = [""]
+        # `None` until the node gets its first child
+        self._children = [None]
+        # Number of times a path ending at the node was added
+        self._counts = [0]
+
+    def __len__(self):
+        return len(self._names)
+
+    @classmethod
+    def split(cls, path):
+        parts = [part for part in path.split(cls.SEPARATOR) if part]
+        if parts and path.startswith(cls.SEPARATOR * 2):
+            # Keep the UNC prefix with the server name.
+            parts[0] = cls.SEPARATOR * 2 + parts[0]
+        return parts
+
+    def add(self, path):
+        """
+        Add `path` and return the ID of its node.
+        """
+        node = self.ROOT
+        for part in self.split(path):
+            children = self._children[node]
+            if children is None:
+                children = self._children[node] = {}
+
+            key = part.casefold()
+            child = children.get(key)
+            if child is None:
+                child = len(self._names)
+                children[sys.intern(key)] = child
+                self._parents.append(node)
+                self._names.append(sys.intern(part))
+                self._children.append(None)
+                self._counts.append(0)
+            node = child
+
+        self._counts[node] += 1
+        return node
+
+    def path(self, node):
+        parts = []
+        while node:
+            parts.append(self._names[node])
+            node = self._parents[node]
+        return self.SEPARATOR.join(reversed(parts))
+
+    def count(self, node):
+        """
+        Number of times the path of `node` itself was added.
+        """
+        return self._counts[node]
+
+    def find(self, prefix):
+        """
+        Return the node of `prefix`, or `None` when no added path starts
+        with it.
+        """
+        node = self.ROOT
+        for part in self.split(prefix):
+            children = self._children[node]
+            node = children.get(part.casefold()) if children else None
+            if node is None:
+                return None
+        return node
+
+    def match(self, pattern):
+        """
+        Return the nodes of all prefixes matching `pattern`, in which `*`
+        stands for any single component, e.g. `C:\\Users\\*\\AppData`.
+        """
+        nodes = [self.ROOT]
+        for part in self.split(pattern):
+            found = []
+            for node in nodes:
+                children = self._children[node]
+                if not children:
+                    continue
+                if part == self.WILDCARD:
+                    found.extend(children.values())
+                else:
+                    child = children.get(part.casefold())
+                    if child is not None:
+                        found.append(child)
+            nodes = found
+        return nodes
+
+    def under(self, pattern):
+        """
+        Yield the nodes of all added paths equal to or below a prefix
+        matching `pattern`, see `match`.
+        """
+        stack = self.match(pattern)
+        while stack:
+            node = stack.pop()
+            if self._counts[node]:
+                yield node
+            children = self._children[node]
+            if children:
+                stack.extend(children.values())
@@ -1,8 +1,8 @@
 import struct
-import warnings
 from struct import unpack
 
-from LnkParse3.text_processor import TextProcessor
+from LnkParse3.diagnostics import WARNINGS
+from LnkParse3.text_processor import get_text_processor
 
 
 """
@@ -22,75 +22,92 @@ ShellLinkHeader.
 
 
 class StringData:
-    def __init__(self, lnk_file, indata=None, cp=None):
+    # (field, flag accessor on `LnkFile`, limit length to 260 characters)
+    FIELDS = (
+        ("description", "has_name", True),
+        ("relative_path", "has_relative_path", True),
+        ("working_directory", "has_working_dir", True),
+        ("command_line_arguments", "has_arguments", False),
+        ("icon_location", "has_icon_location", False),
+    )
+
+    def __init__(
+        self, lnk_file, indata=None, cp=None, lazy=False, diagnostics=WARNINGS, text_processor=None
+    ):
         self._raw = indata
         self._data = {}
+        self._spans = {}
 
         self._lnk_file = lnk_file
-        self.text_processor = TextProcessor(cp=cp)
+        self.diagnostics = diagnostics
+        self.text_processor = text_processor or get_text_processor(cp, diagnostics)
 
         start = 0
         try:
-            if self._lnk_file.has_name():
-                text, length = self.read(self._raw[start:], limit_length=True)
-                self._data["description"] = text
-                start += length
-
-            if self._lnk_file.has_relative_path():
-                text, length = self.read(self._raw[start:], limit_length=True)
-                self._data["relative_path"] = text
-                start += length
-
-            if self._lnk_file.has_working_dir():
-                text, length = self.read(self._raw[start:], limit_length=True)
-                self._data["working_directory"] = text
-                start += length
-
-            if self._lnk_file.has_arguments():
-                text, length = self.read(self._raw[start:])
-                self._data["command_line_arguments"] = text
-                start += length
-
-            if self._lnk_file.has_icon_location():
-                text, length = self.read(self._raw[start:])
-                self._data["icon_location"] = text
-                start += length
+            for field, has_field, limit_length in self.FIELDS:
+                if getattr(self._lnk_file, has_field)():
+                    offset, length = self._measure(self._raw[start:], limit_length)
+                    self._spans[field] = (start + offset, start + offset + length)
+                    start += offset + length
         except struct.error as e:
-            warnings.warn(f"Error while parsing String data: {e!r}")
+            self.diagnostics.report("truncated-string-data", e)
 
         self._size = start
 
+        if not lazy:
+            for field in self._spans:
+                self._get(field)
+
     def size(self):
         return self._size
 
     def description(self):
-        return self._data.get("description")
+        return self._get("description")
 
     def relative_path(self):
-        return self._data.get("relative_path")
+        return self._get("relative_path")
 
     def working_directory(self):
-        return self._data.get("working_directory")
+        return self._get("working_directory")
 
     def command_line_arguments(self):
-        return self._data.get("command_line_arguments")
+        return self._get("command_line_arguments")
 
     def icon_location(self):
-        return self._data.get("icon_location")
+        return self._get("icon_location")
 
-    def read(self, binary, limit_length=False):
+    def _measure(self, binary, limit_length=False):
+        """
+        Return the offset and the length in bytes of a string without
+        decoding it.
+        """
         offset = 2
         char_count = unpack("<H", binary[0:offset])[0]
         length = 260 if limit_length and char_count > 260 else char_count
 
         if self._lnk_file.is_unicode():
-            self._read = self.text_processor.read_unicode_string
             length *= 2  # UTF-16
-        else:
-            self._read = self.text_processor.read_string
 
-        text = self._read(binary[offset : offset + length])
+        return offset, length
+
+    def _decode(self, binary):
+        if self._lnk_file.is_unicode():
+            return self.text_processor.read_unicode_string(binary)
+        return self.text_processor.read_string(binary)
+
+    def _get(self, field):
+        if field not in self._data:
+            if field not in self._spans:
+                return None
+            start, end = self._spans[field]
+            self._data[field] = self._decode(self._raw[start:end])
+        return self._data[field]
+
+    def read(self, binary, limit_length=False):
+        offset, length = self._measure(binary, limit_length)
+        text = self._decode(binary[offset : offset + length])
         return text, offset + length
 
     def as_dict(self):
-        return {k: v for k, v in self._data.items() if v is not None}
+        res = {field: self._get(field) for field in self._spans}
+        return {k: v for k, v in res.items() if v is not None}
@@ -1,3 +1,4 @@
+from LnkParse3.decorators import cached_field
 from LnkParse3.decorators import uuid
 from LnkParse3.target.lnk_target_base import LnkTargetBase
 
@@ -23,6 +24,7 @@ class ControlPanel(LnkTargetBase):
         self.name = "Control panel"
         return super().__init__(*args, **kwargs)
 
+    @cached_field
     @uuid
     def control_panel_item_identifier(self):
         start, end = 14, 30
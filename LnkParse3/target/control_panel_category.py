@@ -1,6 +1,6 @@
-import warnings
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.target.lnk_target_base import LnkTargetBase
 
 
@@ -42,23 +42,21 @@ class ControlPanelCategory(LnkTargetBase):
         self.name = "Control panel category"
         super().__init__(*args, **kwargs)
 
+    @cached_field
     def signature(self):
         start, end = 2, 6
         return unpack("<I", self._raw_target[start:end])[0]
 
+    @cached_field
     def category_id(self):
         start, end = 6, 10
         return unpack("<I", self._raw_target[start:end])[0]
 
+    @cached_field
     def category(self):
         cat_id = self.category_id()
         if cat_id not in self.CATEGORIES:
-            msg = (
-                f"Not implemented category_id {cat_id} "
-                "in ControlPanelCategory.CATEGORIES. "
-                'Use fallback value: "Unknown".'
-            )
-            warnings.warn(msg)
+            self.diagnostics.report("unknown-category", cat_id)
             return "Unknown"
         return self.CATEGORIES[cat_id]
 
@@ -1,5 +1,6 @@
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.target.lnk_target_base import LnkTargetBase
 
 
@@ -69,6 +70,7 @@ class ControlPanelCPL(LnkTargetBase):
         self.name = "Control panel CPL file"
         super().__init__(*args, **kwargs)
 
+    @cached_field
     def _is_unicode(self):
         # Unicode format has 12 bytes of unknown/empty between signature and
         # offsets (bytes 6-17), so bytes 6-9 are typically zero. In the ASCII
@@ -81,29 +83,35 @@ class ControlPanelCPL(LnkTargetBase):
         # In ASCII format, offset 10 starts an ASCII path string.
         return self._raw_target[10] == 0x00
 
+    @cached_field
     def signature(self):
         start, end = 2, 6
         return unpack("<I", self._raw_target[start:end])[0]
 
+    @cached_field
     def _name_offset(self):
         if self._is_unicode():
             return unpack("<H", self._raw_target[18:20])[0]
         return unpack("<H", self._raw_target[6:8])[0]
 
+    @cached_field
     def _comments_offset(self):
         if self._is_unicode():
             return unpack("<H", self._raw_target[20:22])[0]
         return unpack("<H", self._raw_target[8:10])[0]
 
+    @cached_field
     def _strings_start(self):
         return 22 if self._is_unicode() else 10
 
+    @cached_field
     def cpl_file_path(self):
         start = self._strings_start()
         if self._is_unicode():
             return self.text_processor.read_unicode_string(self._raw_target[start:])
         return self.text_processor.read_string(self._raw_target[start:])
 
+    @cached_field
     def name_string(self):
         char_offset = self._name_offset()
         start = self._strings_start()
@@ -113,6 +121,7 @@ class ControlPanelCPL(LnkTargetBase):
         byte_offset = start + char_offset
         return self.text_processor.read_string(self._raw_target[byte_offset:])
 
+    @cached_field
     def comments(self):
         char_offset = self._comments_offset()
         if char_offset == 0:
@@ -0,0 +1,252 @@
+from struct import unpack
+
+from LnkParse3.decorators import cached_field
+from LnkParse3.decorators import dostime
+from LnkParse3.decorators import filetime
+from LnkParse3.diagnostics import WARNINGS
+from LnkParse3.text_processor import get_text_processor
+
+
+"""
+Extension blocks follow the data of some shell items, e.g. file entries and
+root folders.
+----------------------------------------------------------------------
+|              0-7b              |               8-15b               |
+----------------------------------------------------------------------
+|       <u_int16> ExtensionSize  |    <u_int16> ExtensionVersion     |
+----------------------------------------------------------------------
+|                <u_int32> Signature == 0xBEEFxxxx                   |
+----------------------------------------------------------------------
+|                         Data (variable)                            |
+----------------------------------------------------------------------
+|  <u_int16> FirstExtensionBlockVersionOffset                        |
+----------------------------------------------------------------------
+https://github.com/libyal/libfwsi/blob/main/documentation/Windows%20Shell%20Item%20format.asciidoc#5-extension-blocks
+"""
+
+# High word of every extension block signature
+EXTENSION_MAGIC = b"\xef\xbe"
+
+
+class ExtensionBlock:
+    def __init__(
+        self,
+        indata=None,
+        cp=None,
+        diagnostics=WARNINGS,
+        text_processor=None,
+        timestamps="datetime",
+    ):
+        self.name = "Extension block"
+        self._raw = indata
+        self.cp = cp
+        self.diagnostics = diagnostics
+        self.timestamps = timestamps
+        self.text_processor = text_processor or get_text_processor(cp, diagnostics)
+
+    @cached_field
+    def size(self):
+        return unpack("<H", self._raw[0:2])[0]
+
+    @cached_field
+    def version(self):
+        return unpack("<H", self._raw[2:4])[0]
+
+    @cached_field
+    def signature(self):
+        return unpack("<I", self._raw[4:8])[0]
+
+    @cached_field
+    def version_offset(self):
+        """
+        Offset of the block from the start of its shell item.
+        """
+        end = self.size()
+        return unpack("<H", self._raw[end - 2 : end])[0]
+
+    def as_dict(self):
+        return {
+            "class": self.name,
+            "size": self.size(),
+            "version": self.version(),
+            "signature": hex(self.signature()),
+        }
+
+
+"""
+File entry extension, version 3 (Windows XP) and later:
+----------------------------------------------------------------------
+|              0-7b              |               8-15b               |
+----------------------------------------------------------------------
+|                    ExtensionSize, Version, Signature               |
+|                              8 B                                   |
+----------------------------------------------------------------------
+|            <dos_timestamp> CreationDateAndTime                     |
+----------------------------------------------------------------------
+|            <dos_timestamp> LastAccessDateAndTime                   |
+----------------------------------------------------------------------
+|       <u_int16> Identifier     |  Version 7+: Unknown (2 B)        |
+----------------------------------------------------------------------
+|     Version 7+: <u_int64> NTFS file reference, 8 B unknown         |
+----------------------------------------------------------------------
+|     <u_int16> LongStringSize   |  Version 9+: 4 B, Version 8+: 4 B |
+----------------------------------------------------------------------
+|     <unicode_str> LongName, <str/unicode_str> LocalizedName        |
+----------------------------------------------------------------------
+|  <u_int16> FirstExtensionBlockVersionOffset                        |
+----------------------------------------------------------------------
+https://github.com/libyal/libfwsi/blob/main/documentation/Windows%20Shell%20Item%20format.asciidoc#54-file-entry-extension
+"""
+
+
+class FileEntryExtension(ExtensionBlock):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = "File entry extension"
+
+    @cached_field
+    @dostime
+    def creation_time(self):
+        return self._raw[8:12]
+
+    @cached_field
+    @dostime
+    def access_time(self):
+        return self._raw[12:16]
+
+    @cached_field
+    def identifier(self):
+        return unpack("<H", self._raw[16:18])[0]
+
+    @cached_field
+    def _file_reference(self):
+        if self.version() < 7:
+            return None
+        return unpack("<Q", self._raw[20:28])[0]
+
+    @cached_field
+    def mft_entry(self):
+        """
+        MFT entry index of the NTFS file reference, `None` before version 7.
+        """
+        reference = self._file_reference()
+        if reference is None:
+            return None
+        return reference & 0xFFFFFFFFFFFF
+
+    @cached_field
+    def mft_sequence(self):
+        reference = self._file_reference()
+        if reference is None:
+            return None
+        return reference >> 48
+
+    @cached_field
+    def _long_string_size_offset(self):
+        return 36 if self.version() >= 7 else 18
+
+    @cached_field
+    def long_string_size(self):
+        start = self._long_string_size_offset()
+        return unpack("<H", self._raw[start : start + 2])[0]
+
+    @cached_field
+    def _long_name_offset(self):
+        offset = self._long_string_size_offset() + 2
+        if self.version() >= 9:
+            offset += 4
+        if self.version() >= 8:
+            offset += 4
+        return offset
+
+    @cached_field
+    def long_name(self):
+        if self.version() < 3:
+            return None
+        binary = self._raw[self._long_name_offset() : self.size() - 2]
+        return self.text_processor.read_unicode_string(binary)
+
+    @cached_field
+    def _localized_name_offset(self):
+        """
+        Offset right after the UTF-16 terminator of the long name.
+        """
+        end = self.size() - 2
+        offset = self.text_processor.find_unicode_null(self._raw[:end], self._long_name_offset())
+        if offset == -1:
+            return end
+        return offset + 2
+
+    @cached_field
+    def localized_name(self):
+        if self.version() < 3 or not self.long_string_size():
+            return None
+        binary = self._raw[self._localized_name_offset() : self.size() - 2]
+        if self.version() >= 7:
+            return self.text_processor.read_unicode_string(binary)
+        return self.text_processor.read_string(binary)
+
+    def as_dict(self):
+        res = super().as_dict()
+        res["creation_time"] = self.creation_time()
+        res["access_time"] = self.access_time()
+        res["mft_entry"] = self.mft_entry()
+        res["mft_sequence"] = self.mft_sequence()
+        res["long_name"] = self.long_name()
+        res["localized_name"] = self.localized_name()
+        return res
+
+
+"""
+Root folder timestamps extension:
+----------------------------------------------------------------------
+|                    ExtensionSize, Version, Signature               |
+|                              8 B                                   |
+----------------------------------------------------------------------
+|                          Unknown (4 B)                             |
+----------------------------------------------------------------------
+|                     <FILETIME> CreationTime                        |
+|                     <FILETIME> ModificationTime                    |
+|                     <FILETIME> AccessTime                          |
+----------------------------------------------------------------------
+|  <u_int16> FirstExtensionBlockVersionOffset                        |
+----------------------------------------------------------------------
+"""
+
+
+class TimestampsExtension(ExtensionBlock):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = "Timestamps extension"
+
+    @cached_field
+    @filetime
+    def creation_time(self):
+        return self._raw[12:20]
+
+    @cached_field
+    @filetime
+    def modification_time(self):
+        return self._raw[20:28]
+
+    @cached_field
+    @filetime
+    def access_time(self):
+        return self._raw[28:36]
+
+    def as_dict(self):
+        res = super().as_dict()
+        res["creation_time"] = self.creation_time()
+        res["modification_time"] = self.modification_time()
+        res["access_time"] = self.access_time()
+        return res
+
+
+EXTENSION_CLASSES = {
+    0xBEEF0004: FileEntryExtension,
+    0xBEEF0026: TimestampsExtension,
+}
+
+
+def extension_block_class(signature):
+    return EXTENSION_CLASSES.get(signature, ExtensionBlock)
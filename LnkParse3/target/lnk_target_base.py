@@ -1,7 +1,11 @@
-import warnings
 from struct import unpack
+from struct import unpack_from
 
-from LnkParse3.text_processor import TextProcessor
+from LnkParse3.decorators import cached_field
+from LnkParse3.diagnostics import WARNINGS
+from LnkParse3.target.extension_block import extension_block_class
+from LnkParse3.target.extension_block import EXTENSION_MAGIC
+from LnkParse3.text_processor import get_text_processor
 
 
 """
@@ -34,13 +38,25 @@ class LnkTargetBase:
     }
 
     SIZE_OF_TARGET_SIZE = 2
+    # Offset in the item data from which extension blocks are looked for,
+    # `None` for items which cannot have them.
+    EXTENSION_BLOCKS_START = None
 
-    def __init__(self, indata=None, cp=None):
-        self._target = {}
+    def __init__(
+        self,
+        indata=None,
+        cp=None,
+        diagnostics=WARNINGS,
+        text_processor=None,
+        timestamps="datetime",
+    ):
         self.cp = cp
         self._raw = indata
+        self.diagnostics = diagnostics
+        # Representation of the times, see `LnkFile.TIMESTAMPS`
+        self.timestamps = timestamps
 
-        self.text_processor = TextProcessor(cp=self.cp)
+        self.text_processor = text_processor or get_text_processor(self.cp, diagnostics)
 
         start = self.SIZE_OF_TARGET_SIZE
         end = start + self.size()
@@ -51,12 +67,7 @@ class LnkTargetBase:
         for flag, name in self.SHELL_ITEM_SHEL_FS_FOLDER.items():
             if flags & flag == flag:
                 return name
-        msg = (
-            f"Not implemented flags 0x{flags:02X} "
-            "in LnkTargetBase.SHELL_ITEM_SHELL_FS_FOLDER. "
-            'Use fallback value: "Unknown".'
-        )
-        warnings.warn(msg)
+        self.diagnostics.report("unknown-fs-folder-flags", flags)
         return "Unknown"
 
     def as_item(self):
@@ -64,6 +75,14 @@ class LnkTargetBase:
             "class": self.name,
         }
 
+    def path_part(self):
+        """
+        Name this item adds to the target path, `None` for items which are
+        not part of it, e.g. root folders.
+        """
+        return
+
+    @cached_field
     def size(self):
         """ItemIDSize (2 bytes):
         A 16-bit, unsigned integer that specifies the size, in bytes, of the
@@ -73,12 +92,85 @@ class LnkTargetBase:
         size = unpack("<H", self._raw[start:end])[0]
         return size
 
+    @cached_field
     def class_type_indicator(self):
         start, end = 0, 1
         flags = unpack("<B", self._raw_target[start:end])[0]
         return flags
 
+    @cached_field
     def has_unicode_strings(self):
         inv = {v: k for k, v in self.SHELL_ITEM_SHEL_FS_FOLDER.items()}
         mask = inv["Has Unicode strings"]
         return bool(self.class_type_indicator() & mask)
+
+    @cached_field
+    def extension_block_index(self):
+        """
+        `(offset, size, signature)` of every extension block, offsets are
+        relative to the item data. Only the size fields are read, the blocks
+        are decoded by `extension_blocks`.
+        """
+        start = self.EXTENSION_BLOCKS_START
+        if start is None:
+            return ()
+
+        raw = self._raw_target
+        data = bytes(raw[start:])
+        end = len(raw)
+
+        # The first block is found by its signature and confirmed by the
+        # offset stored at its end, which counts from the start of the item.
+        offset = None
+        position = data.find(EXTENSION_MAGIC, 6)
+        while position != -1:
+            candidate = start + position - 6
+            size = unpack_from("<H", raw, candidate)[0]
+            if 8 <= size <= end - candidate:
+                version_offset = unpack_from("<H", raw, candidate + size - 2)[0]
+                if version_offset == candidate + self.SIZE_OF_TARGET_SIZE:
+                    offset = candidate
+                    break
+            position = data.find(EXTENSION_MAGIC, position + 1)
+
+        index = []
+        while offset is not None and offset + 8 <= end:
+            size = unpack_from("<H", raw, offset)[0]
+            if size < 8 or size > end - offset or raw[offset + 6 : offset + 8] != EXTENSION_MAGIC:
+                break
+            signature = unpack_from("<I", raw, offset + 4)[0]
+            index.append((offset, size, signature))
+            offset += size
+        return tuple(index)
+
+    @cached_field
+    def extension_blocks(self):
+        return tuple(
+            extension_block_class(signature)(
+                indata=self._raw_target[offset : offset + size],
+                cp=self.cp,
+                diagnostics=self.diagnostics,
+                text_processor=self.text_processor,
+                timestamps=self.timestamps,
+            )
+            for offset, size, signature in self.extension_block_index()
+        )
+
+    def decode(self):
+        """
+        Decode every field, including the lazily parsed extension blocks, so
+        all anomalies are reported now, e.g. before an `ItemCache` shares it.
+        """
+        self.as_item()
+        for block in self.extension_blocks():
+            block.as_dict()
+
+    def extension_block(self, signature=None):
+        """
+        First extension block with `signature`, e.g. 0xBEEF0004, or `None`.
+        Without `signature` the first block of any kind.
+        """
+        for block in self.extension_blocks():
+            if signature is None or block.signature() == signature:
+                return block
+        return None
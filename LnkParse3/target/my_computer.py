@@ -1,3 +1,4 @@
+from LnkParse3.decorators import cached_field
 from LnkParse3.decorators import uuid
 from LnkParse3.target.lnk_target_base import LnkTargetBase
 
@@ -40,23 +41,30 @@ class MyComputer(LnkTargetBase):
         self.name = "Volume Item"
         super().__init__(*args, **kwargs)
 
+    @cached_field
     def flags(self):
         return self.class_type_indicator() & 0x0F
 
+    @cached_field
     def _has_name(self):
         return bool(self.flags() & 0x01)
 
+    @cached_field
     def volume_name(self):
         if not self._has_name():
             return None
         return self.text_processor.read_string(self._raw_target[1:21])
 
+    @cached_field
     @uuid
     def volume_identifier(self):
         if self._has_name():
             return None
         return self._raw_target[2:18]
 
+    def path_part(self):
+        return self.volume_name()
+
     def as_item(self):
         item = super().as_item()
         item["flags"] = hex(self.flags())
@@ -1,5 +1,6 @@
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.target.lnk_target_base import LnkTargetBase
 
 
@@ -32,17 +33,6 @@ class NetworkLocation(LnkTargetBase):
         self.name = "Network location"
         super().__init__(*args, **kwargs)
 
-        it = self._string_data()
-        self._location = next(it)
-
-        self._description = None
-        if self._has_description():
-            self._description = next(it)
-
-        self._comments = None
-        if self._has_comments():
-            self._comments = next(it)
-
     def as_item(self):
         item = super().as_item()
         item["flags"] = self.flags()
@@ -53,11 +43,13 @@ class NetworkLocation(LnkTargetBase):
         return item
 
     # TODO: rename to class_type_indicator
+    @cached_field
     def flags(self):
         start, end = 0, 1
         flags = unpack("<B", self._raw_target[start:end])[0]
         return self.get_item_shell_fs_folder(flags & 0x0F)
 
+    @cached_field
     def content_flags(self):
         """
         0x40 ⇒ has comments
@@ -67,9 +59,11 @@ class NetworkLocation(LnkTargetBase):
         flags = unpack("<B", self._raw_target[start:end])[0]
         return flags
 
+    @cached_field
     def _has_comments(self):
         return bool(self.content_flags() & 0x40)
 
+    @cached_field
     def _has_description(self):
         return bool(self.content_flags() & 0x80)
 
@@ -78,21 +72,32 @@ class NetworkLocation(LnkTargetBase):
         binary = self._raw_target[start:]
         return self.text_processor.read_strings(binary)
 
+    @cached_field
+    def _strings(self):
+        # The strings follow each other, they are decoded together once the
+        # first of them is needed.
+        it = self._string_data()
+        location = next(it)
+        # Flagged strings may be missing in a truncated item.
+        description = next(it, None) if self._has_description() else None
+        comments = next(it, None) if self._has_comments() else None
+        return location, description, comments
+
     def location(self):
         """
         Contains the network name or UNC path
         ASCII string with end-of-string character
         """
-        return self._location
+        return self._strings()[0]
 
     def description(self):
         """
         ASCII string with end-of-string character
         """
-        return self._description
+        return self._strings()[1]
 
     def comments(self):
         """
         ASCII string with end-of-string character
         """
-        return self._comments
+        return self._strings()[2]
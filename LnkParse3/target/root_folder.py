@@ -1,7 +1,8 @@
-import warnings
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.decorators import uuid
+from LnkParse3.diagnostics import WARNINGS
 from LnkParse3.target.lnk_target_base import LnkTargetBase
 
 
@@ -21,6 +22,10 @@ from LnkParse3.target.lnk_target_base import LnkTargetBase
 
 
 class RootFolder(LnkTargetBase):
+    # Extension blocks follow the ShellFolderID
+    EXTENSION_BLOCKS_START = 18
+    TIMESTAMPS_EXTENSION = 0xBEEF0026
+
     # https://github.com/libyal/libfwsi/blob/master/documentation/Windows%20Shell%20Item%20format.asciidoc#321-sort-index
     SORT_INDEX = {
         0x00: "Internet Explorer",
@@ -39,14 +44,9 @@ class RootFolder(LnkTargetBase):
     }
 
     @classmethod
-    def get_sort_index(cls, sort_index_value):
+    def get_sort_index(cls, sort_index_value, diagnostics=WARNINGS):
         if sort_index_value not in cls.SORT_INDEX:
-            msg = (
-                f"Not implemented sort_index_value {sort_index_value:02X} "
-                "in RootFolder.SORT_INDEX. "
-                'Use fallback value: "Unknown".'
-            )
-            warnings.warn(msg)
+            diagnostics.report("unknown-sort-index", sort_index_value)
             return "Unknown"
         return cls.SORT_INDEX[sort_index_value]
 
@@ -61,21 +61,22 @@ class RootFolder(LnkTargetBase):
         item["guid"] = self.guid()
         return item
 
+    @cached_field
     def sort_index_value(self):
         start, end = 1, 2
         return unpack("<B", self._raw_target[start:end])[0]
 
+    @cached_field
     def sort_index(self):
-        return self.get_sort_index(self.sort_index_value())
+        return self.get_sort_index(self.sort_index_value(), self.diagnostics)
 
+    @cached_field
     @uuid
     def guid(self):
         start, end = 2, 18
         guid = self._raw_target[start:end]
         return guid
 
-    def extension_block(self):
-        if self.item_id_size() > 20:
-            # TODO: Extension block
-            return
-        return
+    @cached_field
+    def timestamps_extension(self):
+        return self.extension_block(self.TIMESTAMPS_EXTENSION)
@@ -1,5 +1,6 @@
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.decorators import dostime
 from LnkParse3.target.lnk_target_base import LnkTargetBase
 
@@ -30,6 +31,9 @@ from LnkParse3.target.lnk_target_base import LnkTargetBase
 # TODO: rename to file_entry
 # https://github.com/libyal/libfwsi/blob/master/documentation/Windows%20Shell%20Item%20format.asciidoc#34-file-entry-shell-item
 class ShellFSFolder(LnkTargetBase):
+    EXTENSION_BLOCKS_START = 12
+    FILE_ENTRY_EXTENSION = 0xBEEF0004
+
     def __init__(self, *args, **kwargs):
         self.name = "File entry"
         super().__init__(*args, **kwargs)
@@ -43,29 +47,37 @@ class ShellFSFolder(LnkTargetBase):
         item["primary_name"] = self.primary_name()
         return item
 
+    def path_part(self):
+        return self.primary_name()
+
     # dup: ./my_computer.py flags()
     # dup: ../target_factory.py item_type()
+    @cached_field
     def flags(self):
         flags = self.class_type_indicator()
 
         # FIXME: delete masking
         return self.get_item_shell_fs_folder(flags & 0x0F)
 
+    @cached_field
     def file_size(self):
         start, end = 2, 6
         size = unpack("<I", self._raw_target[start:end])[0]
         return size
 
+    @cached_field
     @dostime
     def modification_time(self):
         start, end = 6, 10
         return self._raw_target[start:end]
 
+    @cached_field
     def file_attribute_flags(self):
         start, end = 10, 12
         flags = unpack("<H", self._raw_target[start:end])[0]
         return flags
 
+    @cached_field
     def primary_name(self):
         start = 12
         binary = self._raw_target[start:]
@@ -77,11 +89,16 @@ class ShellFSFolder(LnkTargetBase):
 
         return text
 
-    # https://github.com/libyal/libfwsi/blob/master/documentation/Windows%20Shell%20Item%20format.asciidoc#341-file-entry-shell-item--pre-windows-xp
-    def secondary_name(self):
-        # TODO:
-        pass
+    def file_entry_extension(self):
+        return self.extension_block(self.FILE_ENTRY_EXTENSION)
 
-    def shell_folder_identifier(self):
-        # TODO:
-        pass
+    @cached_field
+    def secondary_name(self):
+        """
+        Long name from the file entry extension block, the primary name is
+        often the short 8.3 name.
+        """
+        extension = self.file_entry_extension()
+        if extension is None:
+            return None
+        return extension.long_name()
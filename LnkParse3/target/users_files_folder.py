@@ -1,5 +1,6 @@
 from struct import unpack
 
+from LnkParse3.decorators import cached_field
 from LnkParse3.decorators import uuid
 from LnkParse3.target.lnk_target_base import LnkTargetBase
 from LnkParse3.target.shell_fs_folder import ShellFSFolder
@@ -38,31 +39,51 @@ class UsersFilesFolder(LnkTargetBase):
         self.name = "Users files folder"
         super().__init__(*args, **kwargs)
 
+    @cached_field
     def inner_data_size(self):
         return unpack("<H", self._raw_target[2:4])[0]
 
+    @cached_field
     def signature(self):
-        return self._raw_target[4:8]
+        return bytes(self._raw_target[4:8])
 
+    @cached_field
     def file_entry_size(self):
         return unpack("<H", self._raw_target[8:10])[0]
 
+    @cached_field
     def file_entry(self):
-        return ShellFSFolder(indata=self._raw_target[8:], cp=self.cp)
+        return ShellFSFolder(
+            indata=self._raw_target[8:],
+            cp=self.cp,
+            diagnostics=self.diagnostics,
+            text_processor=self.text_processor,
+            timestamps=self.timestamps,
+        )
 
+    @cached_field
     def _delegate_offset(self):
         return 4 + self.inner_data_size()
 
+    @cached_field
     @uuid
     def delegate_class_id(self):
         offset = self._delegate_offset()
         return self._raw_target[offset : offset + 16]
 
+    @cached_field
     @uuid
     def delegate_folder_id(self):
         offset = self._delegate_offset() + 16
         return self._raw_target[offset : offset + 16]
 
+    def path_part(self):
+        return self.file_entry().primary_name()
+
+    def decode(self):
+        super().decode()
+        self.file_entry().decode()
+
     def as_item(self):
         item = super().as_item()
         item["signature"] = self.signature().decode("ascii", errors="replace")
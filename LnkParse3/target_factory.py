@@ -1,6 +1,7 @@
-import warnings
+from struct import Struct
 from struct import unpack
 
+from LnkParse3.diagnostics import WARNINGS
 from LnkParse3.target.common_places_folder import CommonPlacesFolder
 from LnkParse3.target.compressed_folder import CompressedFolder
 from LnkParse3.target.control_panel import ControlPanel
@@ -16,6 +17,26 @@ from LnkParse3.target.unknown import Unknown
 from LnkParse3.target.users_files_folder import UsersFilesFolder
 
 
+_ITEM_SIZE = Struct("<H")
+_ITEM_TYPE = Struct("<B")
+
+
+def _class_table(shell_item_classes):
+    """
+    Map every possible type indicator to its class, `None` marks the types
+    which are not implemented.
+    """
+    table = []
+    for item_type in range(256):
+        # 0x20, 0x30, and 0x40 should have an 0x70 bitmask applied per
+        # https://github.com/libyal/libfwsi/blob/main/documentation/Windows%20Shell%20Item%20format.asciidoc
+        masked_item_type = item_type & 0x70
+        if masked_item_type in (0x20, 0x30, 0x40):
+            item_type = masked_item_type
+        table.append(shell_item_classes.get(item_type))
+    return tuple(table)
+
+
 class TargetFactory:
     # https://github.com/libyal/libfwsi/blob/master/documentation/Windows%20Shell%20Item%20format.asciidoc#3-type-indicator-based-shell-items
     SHELL_ITEM_CLASSES = {
@@ -34,22 +55,18 @@ class TargetFactory:
         0x73: CommonPlacesFolder,
         0x74: UsersFilesFolder,
     }
+    CLASS_TABLE = _class_table(SHELL_ITEM_CLASSES)
 
     @classmethod
-    def get_shell_item_classes(cls, item_type):
+    def get_shell_item_classes(cls, item_type, diagnostics=WARNINGS):
         if item_type not in cls.SHELL_ITEM_CLASSES:
-            msg = (
-                f"Not implemented item_type 0x{item_type:02X} "
-                "in TargetFactory.SHELL_ITEM_CLASSES. "
-                f"Use fallback value: {Unknown!r}."
-            )
-            warnings.warn(msg)
+            diagnostics.report("unknown-item-type", item_type, Unknown)
             return Unknown
         return cls.SHELL_ITEM_CLASSES[item_type]
 
-    def __init__(self, indata):
-        self._target = {}
+    def __init__(self, indata, diagnostics=WARNINGS):
         self._raw = indata
+        self.diagnostics = diagnostics
 
     def item_size(self):
         """ItemIDSize (2 bytes):
@@ -75,15 +92,68 @@ class TargetFactory:
             # TerminalID
             return None
 
-        item_type = self.item_type()
+        return self._class(self.item_type(), self.diagnostics)
 
-        # XXX: Move to table
-        # 0x20, 0x30, and 0x40 should have an 0x70 bitmask applied per
-        # https://github.com/libyal/libfwsi/blob/main/documentation/Windows%20Shell%20Item%20format.asciidoc
-        masked_item_type = item_type & 0x70
-        if masked_item_type in [0x20, 0x30, 0x40]:
-            target = self.get_shell_item_classes(masked_item_type)
-        else:
-            target = self.get_shell_item_classes(item_type)
+    @classmethod
+    def _class(cls, item_type, diagnostics):
+        target_class = cls.CLASS_TABLE[item_type]
+        if target_class is None:
+            # Report and fall back to `Unknown`.
+            return cls.get_shell_item_classes(item_type, diagnostics)
+        return target_class
+
+    @classmethod
+    def scan(cls, binary, diagnostics=WARNINGS):
+        """
+        Walk an IDList once and return `(offset, size, class)` of every ItemID
+        up to the TerminalID. Nothing is constructed, the offsets can be used
+        to create the targets later.
+        """
+        items = []
+        offset, end = 0, len(binary)
+        while offset < end:
+            size = _ITEM_SIZE.unpack_from(binary, offset)[0]
+            if size == 0:
+                # TerminalID
+                break
+
+            item_type = _ITEM_TYPE.unpack_from(binary, offset + 2)[0]
+            items.append((offset, size, cls._class(item_type, diagnostics)))
+            offset += size
+        return tuple(items)
 
-        return target
+    @classmethod
+    def targets(
+        cls,
+        binary,
+        cp=None,
+        diagnostics=WARNINGS,
+        item_cache=None,
+        text_processor=None,
+        timestamps="datetime",
+    ):
+        """
+        Create the targets of all ItemIDs of an IDList. With an `ItemCache`,
+        items already seen in other IDLists are reused instead of parsed, they
+        keep their own `TextProcessor`.
+        """
+        items = cls.scan(binary, diagnostics)
+        if item_cache is None:
+            return tuple(
+                target_class(
+                    indata=binary[offset:],
+                    cp=cp,
+                    diagnostics=diagnostics,
+                    text_processor=text_processor,
+                    timestamps=timestamps,
+                )
+                for offset, _, target_class in items
+            )
+        # A target reads `ItemIDSize` bytes after its size field, i.e. two
+        # bytes past its item, the cached one must see the very same window.
+        return tuple(
+            item_cache.target(
+                target_class, binary[offset : offset + size + 2], cp, diagnostics, timestamps
+            )
+            for offset, size, target_class in items
+        )
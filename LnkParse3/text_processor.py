@@ -6,79 +6,103 @@ the terminating null character are undefined and can have any value. The
 undefined bytes MUST NOT be used.
 """
 
-import warnings
+import codecs
+import functools
+import re
+
+from LnkParse3.diagnostics import WARNINGS
+
+
+@functools.cache
+def _cp_decoder(cp):
+    # Codec functions are looked up once per code page and process, calling
+    # them directly skips the codec registry lookup `str(binary, encoding)`
+    # does on every call.
+    return codecs.lookup(cp).decode
 
 
 class TextProcessor:
-    def __init__(self, cp=None):
+    # `re` searches any buffer in place, so a terminator is found at C speed
+    # without copying a `memoryview` into `bytes` first.
+    NULL = re.compile(b"\x00")
+    UNICODE_NULL = re.compile(b"\x00\x00")
+
+    def __init__(self, cp=None, diagnostics=None):
         self.cp = cp or "cp1252"
+        self.diagnostics = WARNINGS if diagnostics is None else diagnostics
+        self._cp_decode = _cp_decoder(self.cp)
+        self._utf8_decode = codecs.utf_8_decode
+        self._utf16_decode = codecs.utf_16_le_decode
+
+    def _decode(self, binary):
+        try:
+            string = self._cp_decode(binary)[0]
+        except UnicodeDecodeError:
+            # Fallback to UTF-8 before giving up.
+            try:
+                string = self._utf8_decode(binary, "strict", True)[0]
+            except UnicodeDecodeError as e:
+                string = self._cp_decode(binary, "replace")[0]
+                self.diagnostics.report("undecodable-string", string, e)
+        return string
 
     def read_strings(self, binary):
-        chars = []
+        start = 0
+        for match in self.NULL.finditer(binary):
+            yield self._decode(binary[start : match.start()])
+            start = match.end()
 
-        def _chars_to_string(lst):
-            bin_string = b"".join(lst)
-            try:
-                string = bin_string.decode(self.cp)
-            except UnicodeDecodeError:
-                # Fallback to UTF-8 before giving up.
-                try:
-                    string = bin_string.decode("utf-8")
-                except UnicodeDecodeError as e:
-                    string = bin_string.decode(self.cp, errors="replace")
-                    msg = f"Error while decoding string `{string}` ({e})"
-                    warnings.warn(msg)
-            yield string
-
-        for char in binary:
-            if char == 0x00:
-                yield from _chars_to_string(chars)
-                chars = []
-            else:
-                chars.append(bytes([char]))
-
-        yield from _chars_to_string(chars)
+        yield self._decode(binary[start:])
 
     def read_string(self, binary):
         it = self.read_strings(binary)
         return next(it)
 
-    def read_unicode_strings(self, binary):
-        chars = []
+    def _decode_unicode(self, binary):
+        try:
+            string = self._utf16_decode(binary, "strict", True)[0]
+        except UnicodeDecodeError as e:
+            string = self._utf16_decode(binary, "replace", True)[0]
+            self.diagnostics.report("undecodable-string", string, e)
+        return string
 
-        def _chars_to_string(lst):
-            bin_string = b"".join(lst)
-            try:
-                string = bin_string.decode("utf-16le")
-            except UnicodeDecodeError as e:
-                string = bin_string.decode("utf-16le", errors="replace")
-                msg = f"Error while decoding string `{string}` ({e})"
-                warnings.warn(msg)
-            yield string
+    def find_unicode_null(self, binary, pos):
+        """
+        Find the next UTF-16 terminator at an even offset, a `\x00\x00` pair
+        spanning two code units is skipped.
+        """
+        match = self.UNICODE_NULL.search(binary, pos)
+        while match and match.start() % 2:
+            match = self.UNICODE_NULL.search(binary, match.start() + 1)
+        return match.start() if match else -1
 
-        for char in self._2bytes_each(binary):
-            if char == b"\x00\x00":
-                yield from _chars_to_string(chars)
-                chars = []
-            else:
-                chars.append(char)
+    def read_unicode_strings(self, binary):
+        start = 0
+        end = self.find_unicode_null(binary, start)
+        while end != -1:
+            yield self._decode_unicode(binary[start:end])
+            start = end + 2
+            end = self.find_unicode_null(binary, start)
 
-        yield from _chars_to_string(chars)
+        yield self._decode_unicode(binary[start:])
 
     def read_unicode_string(self, binary):
         it = self.read_unicode_strings(binary)
         return next(it)
 
-    @staticmethod
-    def _2bytes_each(binary):
-        it = iter(binary)
-        while True:
-            tmp = None
-            try:
-                tmp = bytes([next(it)])
-                tmp += bytes([next(it)])
-                yield tmp
-            except StopIteration:
-                if tmp:
-                    yield tmp
-                return None
+
+@functools.cache
+def _shared_text_processor(cp):
+    return TextProcessor(cp=cp)
+
+
+def get_text_processor(cp=None, diagnostics=None):
+    """
+    Return a `TextProcessor` for a structure used on its own, `LnkFile`
+    passes the one of its parse down the tree instead. Without `diagnostics`
+    it is created once per process, e.g. once per batch worker. Otherwise it
+    merely binds the sink, the codec of `cp` is looked up once per process.
+    """
+    if diagnostics is None:
+        return _shared_text_processor(cp)
+    return TextProcessor(cp=cp, diagnostics=diagnostics)
@@ -1,11 +1,29 @@
+import calendar
+import functools
+import importlib
 import sys
-import warnings
 from datetime import datetime
+from datetime import timedelta
 from datetime import timezone
 from struct import unpack
 
+from LnkParse3.diagnostics import WARNINGS
 
-def parse_uuid(binary):
+
+# FILETIME counts 100-nanosecond intervals since January 1, 1601 (UTC).
+FILETIME_EPOCH = datetime(1601, 1, 1, tzinfo=timezone.utc)
+EPOCH_AS_FILETIME = 116444736000000000
+_MICROSECOND = timedelta(microseconds=1)
+# Range of FILETIME values which round to a microsecond `datetime` can
+# represent, see `parse_filetime`.
+MIN_FILETIME = (datetime.min.replace(tzinfo=timezone.utc) - FILETIME_EPOCH) // _MICROSECOND * 10 - 5
+MAX_FILETIME = (datetime.max.replace(tzinfo=timezone.utc) - FILETIME_EPOCH) // _MICROSECOND * 10 + 4
+
+
+# The same GUIDs (shell folders, known folders, property sets) repeat
+# across files, each distinct one is formatted once.
+@functools.lru_cache(maxsize=4096)
+def _format_uuid(binary):
     # UUID variants
     # https://docs.microsoft.com/en-us/openspecs/windows_protocols/ms-dtyp/49e490b8-f972-45d6-a3a4-99f924998d97
     # Also see Java implementation (mslinks)
@@ -15,40 +33,52 @@ def parse_uuid(binary):
 
     uuid = "%08X-%04X-%04X-%04X-%04X%08X" % (d1, d2, d3, d4, d51, d52)
 
-    return uuid
+    return sys.intern(uuid)
 
 
-def _quad_to_hex(quad):
-    # An implemetation is based on
-    # https://metadataconsulting.blogspot.com/2019/12/CSharp-Convert-a-GUID-to-a-Darwin-Descriptor-and-back.html
-    base_85 = (
-        "!$%&'()*+,-.0123456789=?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[]^_`abcdefghijklmnopqrstuvwxyz{}~"
-    )
-    i = 5
-    ddec = 0
-    while i >= 1:
-        char = quad[i - 1]
-        b85 = base_85.find(char)
-        ddec = ddec + b85
-        if i > 1:
-            ddec = ddec * 85
-        i -= 1
+def parse_uuid(binary):
+    # Copy the 16 bytes, a view would keep the whole input alive in the cache.
+    return _format_uuid(bytes(binary[0:16]))
 
-    return f"{ddec:08X}"
 
+_known_guids = None
 
-def parse_packed_uuid(text):
-    if text is None:
-        return None
 
-    # An implemetation is based on
-    # https://metadataconsulting.blogspot.com/2019/12/CSharp-Convert-a-GUID-to-a-Darwin-Descriptor-and-back.html
-    quad1 = _quad_to_hex(text[0:5])
-    quad2 = _quad_to_hex(text[5:10])
-    quad3 = _quad_to_hex(text[10:15])
-    quad4 = _quad_to_hex(text[15:20])
-    quads = quad1 + quad2 + quad3 + quad4
+def guid_name(uuid):
+    """
+    Return the name of a well-known shell folder CLSID or KNOWNFOLDERID, e.g.
+    `guid_name("20D04FE0-3AEA-1069-A2D8-08002B30309D") == "My Computer"`, or
+    `None` for other GUIDs. The table is imported on the first call.
+    """
+    global _known_guids
+    if _known_guids is None:
+        _known_guids = importlib.import_module("LnkParse3.known_guids").KNOWN_GUIDS
+    return _known_guids.get(uuid.upper())
+
 
+# An implemetation is based on
+# https://metadataconsulting.blogspot.com/2019/12/CSharp-Convert-a-GUID-to-a-Darwin-Descriptor-and-back.html
+_BASE_85_DIGITS = (
+    "!$%&'()*+,-.0123456789=?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[]^_`abcdefghijklmnopqrstuvwxyz{}~"
+)
+# Value of every character code below 256, characters outside the alphabet
+# count as -1.
+_BASE_85 = [-1] * 256
+for _value, _char in enumerate(_BASE_85_DIGITS):
+    _BASE_85[ord(_char)] = _value
+del _value, _char
+
+
+def _quad_to_int(quad):
+    # Five base-85 digits, the least significant one first.
+    ddec = 0
+    for i in range(4, -1, -1):
+        code = ord(quad[i])
+        ddec = ddec * 85 + (_BASE_85[code] if code < 256 else -1)
+    return ddec
+
+
+def _reshuffle_packed_uuid(quads):
     d1 = quads[:8]
     d2 = quads[12:16]
     d3 = quads[8:12]
@@ -78,26 +108,52 @@ def parse_packed_uuid(text):
     return uuid
 
 
-def parse_filetime(binary):
+# Advertised shortcuts of one product share their descriptors, each distinct
+# packed GUID is decoded once.
+@functools.lru_cache(maxsize=1024)
+def _decode_packed_uuid(text):
+    quads = [_quad_to_int(text[start : start + 5]) for start in (0, 5, 10, 15)]
+    if not all(0 <= quad <= 0xFFFFFFFF for quad in quads):
+        # Not a valid packed GUID, keep the layout of its hex digits.
+        return _reshuffle_packed_uuid("".join(f"{quad:08X}" for quad in quads))
+
+    quad1, quad2, quad3, quad4 = quads
+    # Data4 is stored as two little-endian 32-bit quads.
+    data4 = (quad3.to_bytes(4, "little") + quad4.to_bytes(4, "little")).hex().upper()
+    return "%08X-%04X-%04X-%s-%s" % (quad1, quad2 & 0xFFFF, quad2 >> 16, data4[:4], data4[4:])
+
+
+def parse_packed_uuid(text):
+    if text is None:
+        return None
+
+    return _decode_packed_uuid(text)
+
+
+def parse_filetime(binary, diagnostics=WARNINGS, timestamps="datetime"):
+    """
+    Decode a FILETIME as a `datetime`, or with `timestamps` as the "raw"
+    integer or as "epoch_ns" nanoseconds since the Unix epoch.
+    """
     #
     # Source:
     #   https://gist.github.com/Mostafa-Hamdy-Elgiar/9714475f1b3bc224ea063af81566d873
     #   https://stackoverflow.com/questions/38878647/python-convert-filetime-to-datetime-for-dates-before-1970
     #   https://computerforensics.parsonage.co.uk/downloads/TheMeaningofLIFE.pdf
-    try:
-        nanosec = unpack("<q", binary)[0]
+    filetime = unpack("<q", binary)[0]
+    if timestamps == "raw":
+        return filetime
+    if timestamps == "epoch_ns":
+        return filetime_to_epoch_ns(filetime)
 
-        if nanosec == 0:
-            # If the date is 0 it means that the file has been created in an
-            # application, then saved from it, and never ever opened.
-            return None
-
-        epoch_as_filetime = 116444736000000000
-        hundreds_of_nanoseconds = 10000000
+    if filetime == 0:
+        # If the date is 0 it means that the file has been created in an
+        # application, then saved from it, and never ever opened.
+        return None
 
-        timestamp = (nanosec - epoch_as_filetime) / hundreds_of_nanoseconds
-        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
-    except (OSError, OverflowError, ValueError):
+    # Integer arithmetic only, a range check replaces catching the errors
+    # of a float conversion.
+    if not MIN_FILETIME <= filetime <= MAX_FILETIME:
         if sys.version_info < (3, 8, 0):
             # HACK for older versions for bytes.hex()
             # https://docs.python.org/3.9/library/stdtypes.html?highlight=hex#bytes.hex
@@ -105,12 +161,24 @@ def parse_filetime(binary):
             invalid_date = " ".join(a + b for a, b in zip(iterator, iterator, strict=False))
         else:
             invalid_date = binary.hex(" ")
-        msg = "Invalid filetime: %s" % invalid_date
-        warnings.warn(msg)
+        diagnostics.report("invalid-filetime", invalid_date)
+        return None
+
+    # Round to the nearest microsecond.
+    return FILETIME_EPOCH + timedelta(0, 0, (filetime + 5) // 10)
+
+
+def filetime_to_epoch_ns(filetime):
+    """
+    Convert a raw FILETIME to nanoseconds since the Unix epoch. A zero
+    FILETIME means that no time is set and is returned as `None`.
+    """
+    if filetime == 0:
         return None
+    return (filetime - EPOCH_AS_FILETIME) * 100
 
 
-def parse_dostime(binary):
+def parse_dostime(binary, diagnostics=WARNINGS, timestamps="datetime"):
     r"""
     The DOS date/time format is a bitmask:
     24                16                 8                 0
@@ -122,6 +190,9 @@ def parse_dostime(binary):
     The year is stored as an offset from 1980.
     Seconds are stored in two-second increments.
     (So if the "second" value is 15, it actually represents 30 seconds.)
+
+    With `timestamps`, the "raw" 32-bit value or "epoch_ns" nanoseconds
+    since the Unix epoch are returned instead of a `datetime`.
     """
 
     #
@@ -131,38 +202,66 @@ def parse_dostime(binary):
     #   https://docs.microsoft.com/pl-pl/windows/desktop/api/winbase/nf-winbase-dosdatetimetofiletime
     #   https://github.com/log2timeline/dfdatetime/wiki/Date-and-time-values
     #
-    try:
-        dos = unpack("<I", binary)[0]
-        # NOTE An alternative solution for DOS conversion is to use
-        # `dfdatetime` package. It returns the same date-time for all
-        # currently available tests.
-        # from dfdatetime.fat_date_time import FATDateTime
-        # timestamp = FATDateTime(dos).CopyToPosixTimestamp()
-        # return datetime.fromtimestamp(timestamp, tz=timezone.utc)
-
-        if dos == 0:
-            # If the date is 0 it means that the file has been created in an
-            # application, then saved from it, and never ever opened.
-            return None
-
-        ymdhms = (
-            ((dos & 0x0000FE00) >> 9) + 1980,
-            ((dos & 0x000001E0) >> 5),
-            ((dos & 0x0000001F) >> 0),
-            ((dos & 0xF8000000) >> 27),
-            ((dos & 0x07E00000) >> 21),
-            ((dos & 0x001F0000) >> 16) * 2,
-        )
-
-        return datetime(*ymdhms, tzinfo=timezone.utc)
-    except ValueError:
-        if sys.version_info < (3, 8, 0):
-            # HACK for older versions for bytes.hex()
-            # https://docs.python.org/3.9/library/stdtypes.html?highlight=hex#bytes.hex
-            iterator = iter(binary.hex())
-            invalid_date = " ".join(a + b for a, b in zip(iterator, iterator, strict=False))
-        else:
-            invalid_date = binary.hex(" ")
-        msg = "Invalid dostime: %s" % invalid_date
-        warnings.warn(msg)
+    dos = unpack("<I", binary)[0]
+    if timestamps == "raw":
+        return dos
+
+    # NOTE An alternative solution for DOS conversion is to use
+    # `dfdatetime` package. It returns the same date-time for all
+    # currently available tests.
+    # from dfdatetime.fat_date_time import FATDateTime
+    # timestamp = FATDateTime(dos).CopyToPosixTimestamp()
+    # return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+    if dos == 0:
+        # If the date is 0 it means that the file has been created in an
+        # application, then saved from it, and never ever opened.
         return None
+
+    ymdhms = (
+        ((dos & 0x0000FE00) >> 9) + 1980,
+        ((dos & 0x000001E0) >> 5),
+        ((dos & 0x0000001F) >> 0),
+        ((dos & 0xF8000000) >> 27),
+        ((dos & 0x07E00000) >> 21),
+        ((dos & 0x001F0000) >> 16) * 2,
+    )
+
+    if timestamps == "epoch_ns":
+        if _valid_ymdhms(*ymdhms):
+            return _epoch_seconds(*ymdhms) * 1_000_000_000
+    else:
+        try:
+            return datetime(*ymdhms, tzinfo=timezone.utc)
+        except ValueError:
+            pass
+
+    if sys.version_info < (3, 8, 0):
+        # HACK for older versions for bytes.hex()
+        # https://docs.python.org/3.9/library/stdtypes.html?highlight=hex#bytes.hex
+        iterator = iter(binary.hex())
+        invalid_date = " ".join(a + b for a, b in zip(iterator, iterator, strict=False))
+    else:
+        invalid_date = binary.hex(" ")
+    diagnostics.report("invalid-dostime", invalid_date)
+    return None
+
+
+def _valid_ymdhms(year, month, day, hour, minute, second):
+    # The checks of the `datetime` constructor, without creating one.
+    if not 1 <= month <= 12:
+        return False
+    days = calendar.mdays[month] + (month == 2 and calendar.isleap(year))
+    return 1 <= day <= days and hour < 24 and minute < 60 and second < 60
+
+
+def _epoch_seconds(year, month, day, hour, minute, second):
+    # Days since the Unix epoch of a proleptic Gregorian date, see
+    # https://howardhinnant.github.io/date_algorithms.html#days_from_civil
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    days = era * 146097 + day_of_era - 719468
+    return ((days * 24 + hour) * 60 + minute) * 60 + second
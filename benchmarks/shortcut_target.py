@@ -0,0 +1,53 @@
+"""
+Compare the full parse with the fast shortcut target extraction on the
+`tests/samples` corpus.
+
+    python benchmarks/shortcut_target.py
+"""
+
+import base64
+import os
+import timeit
+import warnings
+
+import LnkParse3
+
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "tests", "samples")
+
+
+def load_samples():
+    samples = []
+    for entry in sorted(os.scandir(SAMPLES_DIR), key=lambda e: e.name):
+        with open(entry.path, "rb") as fp:
+            samples.append(base64.b64decode(fp.read()))
+    return samples
+
+
+def full_parse(samples):
+    for indata in samples:
+        LnkParse3.lnk_file(indata=indata).lnk_command  # noqa: B018
+
+
+def fast_path(samples):
+    for indata in samples:
+        LnkParse3.shortcut_target(indata=indata)
+
+
+def main():
+    warnings.simplefilter("ignore")
+    samples = load_samples()
+    number = 200
+
+    full = min(timeit.repeat(lambda: full_parse(samples), number=number, repeat=5))
+    fast = min(timeit.repeat(lambda: fast_path(samples), number=number, repeat=5))
+
+    per_file = 1e6 / (number * len(samples))
+    print(f"{len(samples)} samples, {number} rounds")
+    print(f"full parse:  {full * per_file:8.1f} us/file")
+    print(f"fast path:   {fast * per_file:8.1f} us/file")
+    print(f"speedup:     {full / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Time `TextProcessor.read_unicode_string` on UTF-16 strings of the sizes found
+in `StringData` (command line arguments up to 4096 characters) and in the
+fixed 520-byte fields of extra data blocks.
+
+    python benchmarks/unicode_strings.py
+"""
+
+import timeit
+
+from LnkParse3.text_processor import TextProcessor
+
+
+def string_data_field(length):
+    # StringData arguments are counted and not terminated.
+    return memoryview(("-EncodedCommand A" * length)[:length].encode("utf-16le"))
+
+
+def fixed_field(length):
+    # e.g. EnvironmentVariablesDataBlock.TargetUnicode, 260 WCHARs padded with zeros.
+    text = ("C:\\Windows\\System32\\" * length)[:length].encode("utf-16le")
+    return memoryview(text.ljust(520, b"\x00"))
+
+
+def main():
+    text_processor = TextProcessor()
+    number = 2000
+
+    cases = [(f"string data, {n:4} chars", string_data_field(n)) for n in (16, 260, 1024, 4096)]
+    cases += [(f"520-byte field, {n:3} chars", fixed_field(n)) for n in (16, 128, 259)]
+
+    for name, binary in cases:
+        elapsed = min(
+            timeit.repeat(
+                lambda b=binary: text_processor.read_unicode_string(b), number=number, repeat=5
+            )
+        )
+        print(f"{name}: {elapsed * 1e6 / number:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,49 @@
+import asyncio
 import base64
+import codecs
+import datetime
 import json
 import os
 import struct
+import tempfile
 import unittest
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from contextlib import redirect_stdout
 from io import StringIO
+from pathlib import Path
+from unittest import mock
 
 import LnkParse3
+from LnkParse3.batch import aparse_many
+from LnkParse3.batch import index_target_paths
+from LnkParse3.batch import iter_files
+from LnkParse3.batch import parse_tree
+from LnkParse3.diagnostics import Diagnostics
+from LnkParse3.exceptions import LnkParserError
+from LnkParse3.item_cache import ItemCache
+from LnkParse3.lnk_file import main
+from LnkParse3.lnk_header import LinkFlags
+from LnkParse3.lnk_header import LnkHeader
+from LnkParse3.lnk_targets import LnkTargets
+from LnkParse3.ndjson import NDJSONWriter
+from LnkParse3.ndjson import json_ready
+from LnkParse3.path_trie import PathTrie
+from LnkParse3.target_factory import TargetFactory
+from LnkParse3.target.extension_block import FileEntryExtension
 from LnkParse3.target.network_location import NetworkLocation
 from LnkParse3.extra.metadata import SerializedPropertyStorage
 from LnkParse3.text_processor import TextProcessor
+from LnkParse3.text_processor import get_text_processor
+from LnkParse3.utils import FILETIME_EPOCH
+from LnkParse3.utils import MAX_FILETIME
+from LnkParse3.utils import MIN_FILETIME
+from LnkParse3.utils import guid_name
+from LnkParse3.utils import parse_dostime
+from LnkParse3.utils import parse_filetime
+from LnkParse3.utils import parse_packed_uuid
+from LnkParse3.utils import parse_uuid
 
 
 TARGET_DIR = os.path.join(os.path.dirname(__file__), 'samples')
@@ -133,6 +165,29 @@ class TestSamples(unittest.TestCase):
 
         self.assertEqual(our, their)
 
+    def test_cli_shortcut_target(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'microsoft_example.lnk')
+            with open_sample('tests/samples/microsoft_example') as indata, open(path, 'wb') as fp:
+                fp.write(indata)
+
+            cases = (
+                (['-t'], 'shortcut_target_only.txt', str),
+                (['-t', '-j'], 'shortcut_target_only.json', json.loads),
+            )
+            for args, name, load in cases:
+                with self.subTest(args=args):
+                    mock_stdout = StringIO()
+                    extractor = mock.Mock(wraps=LnkParse3.shortcut_target)
+                    with mock.patch('sys.argv', ['lnkparse', *args, path]), \
+                            mock.patch.dict(main.__globals__, shortcut_target=extractor), \
+                            redirect_stdout(mock_stdout):
+                        main()
+                    extractor.assert_called_once()
+
+                    with open(os.path.join(JSON_DIR, name), 'r') as fp:
+                        self.assertEqual(load(mock_stdout.getvalue()), load(fp.read()))
+
     def test_print_unknown_target(self):
         with open_sample('tests/samples/unknown_target') as indata:
             lnk = LnkParse3.lnk_file(indata=indata)
@@ -210,6 +265,8 @@ class TestSamples(unittest.TestCase):
         with open_sample('tests/raw/NetworkLocation') as indata:
             network_location = NetworkLocation(indata=indata)
 
+        # Strings are decoded on first access only.
+        self.assertNotIn('_strings', vars(network_location))
         our = network_location.as_item()
 
         json_path = os.path.join(JSON_DIR, "NetworkLocation.json")
@@ -218,6 +275,16 @@ class TestSamples(unittest.TestCase):
 
         self.assertDictEqual(our, their)
 
+        # A truncated item has only the location, although the description
+        # and comments are flagged.
+        body = b'\x41\x00\xc0' + b'srv'
+        indata = struct.pack('<H', len(body) + 2) + body
+        truncated = NetworkLocation(indata=indata, diagnostics=Diagnostics())
+        self.assertEqual(
+            (truncated.location(), truncated.description(), truncated.comments()),
+            ('srv', None, None),
+        )
+
     def test_serialized_property_storage(self):
         with open_sample('tests/raw/SerializedPropertyStorage') as indata:
             storage = SerializedPropertyStorage(indata, TextProcessor())
@@ -230,6 +297,580 @@ class TestSamples(unittest.TestCase):
 
         self.assertDictEqual(our, their)
 
+    def test_sections_share_input_buffer(self):
+        with open_sample('tests/samples/microsoft_example') as indata:
+            buffer = bytearray(indata)
+
+        lnk = LnkParse3.lnk_file(indata=buffer, lazy=True)
+        self.assertIs(lnk.targets.raw_id_list().obj, buffer)
+
+        # Nothing was copied, later decoded fields see changes of the input.
+        buffer[buffer.index(b'a\x00.\x00', lnk.section_index['string_data'][0])] = ord('b')
+        buffer[buffer.index(b'chris-xps', lnk.section_index['extras'][0])] = ord('C')
+        self.assertEqual(lnk.string_data.relative_path(), '.\\b.txt')
+        self.assertEqual(lnk.extras.data[0].machine_id(), 'Chris-xps')
+
+    def test_shared_text_processor(self):
+        with open_sample('tests/samples/microsoft_example') as indata:
+            lnk = LnkParse3.lnk_file(indata=indata, cp='cp1250')
+
+        text_processor = lnk.text_processor
+        self.assertIs(text_processor.diagnostics, lnk.diagnostics)
+        self.assertIs(lnk.string_data.text_processor, text_processor)
+        self.assertIs(lnk.info.text_processor, text_processor)
+        for target in lnk.targets:
+            self.assertIs(target.text_processor, text_processor)
+        for extra in lnk.extras:
+            self.assertIs(extra.text_processor, text_processor)
+        self.assertIsNot(get_text_processor('cp1250'), text_processor)
+
+        # Every parse binds its own sink, even a shared one, and the codec is
+        # looked up only once.
+        diagnostics = Diagnostics()
+        with mock.patch('codecs.lookup', wraps=codecs.lookup) as lookup:
+            first = LnkParse3.lnk_file(indata=indata, cp='cp1250', diagnostics=diagnostics)
+            second = LnkParse3.lnk_file(indata=indata, cp='cp1250', diagnostics=diagnostics)
+        self.assertIsNot(first.text_processor, second.text_processor)
+        self.assertIs(second.text_processor.diagnostics, diagnostics)
+        lookup.assert_not_called()
+
+    def test_diagnostics(self):
+        with open_sample('tests/samples/padded_cli_arguments') as indata, \
+                warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            lnk = LnkParse3.lnk_file(indata=indata)
+            lnk.get_json()
+            silent = LnkParse3.lnk_file(indata=indata, diagnostics=False)
+            silent.get_json()
+
+        self.assertEqual(caught, [])
+        self.assertEqual(lnk.diagnostics.counts, {'invalid-dostime': 3})
+        self.assertEqual(lnk.diagnostics.messages()[0], 'Invalid dostime: 10 10 10 00')
+        self.assertEqual(len(silent.diagnostics), 0)
+
+        shared = Diagnostics()
+        for name in ('padded_cli_arguments', 'unknown_target'):
+            with open_sample(f'tests/samples/{name}') as indata:
+                LnkParse3.lnk_file(indata=indata, diagnostics=shared).get_json()
+        self.assertEqual(shared.counts, {'invalid-dostime': 3, 'unknown-sort-index': 1})
+
+    def test_timestamps(self):
+        with open_sample('tests/samples/network_info') as indata:
+            lnk = LnkParse3.lnk_file(indata=indata)
+            raw = LnkParse3.lnk_file(indata=indata, timestamps='raw')
+
+        header = lnk.get_json()['header']
+        self.assertEqual(str(header['creation_time']), '2018-11-23 11:31:09.534439+00:00')
+        self.assertEqual(raw.get_json()['header']['creation_time'], 131874462695344385)
+
+        header_ns = lnk.get_json(timestamps='epoch_ns')['header']
+        self.assertEqual(header_ns['creation_time'], 1542972669534438500)
+        for key in ('creation_time', 'accessed_time', 'modified_time'):
+            self.assertEqual(header_ns[key] // 10**9, int(header[key].timestamp()))
+
+        with self.assertRaises(LnkParserError):
+            lnk.get_json(timestamps='iso')
+
+        # Shell item times follow the representation too.
+        with open_sample('tests/samples/microsoft_example') as indata:
+            lnk = LnkParse3.lnk_file(indata=indata)
+            raw = LnkParse3.lnk_file(indata=indata, timestamps='raw')
+
+        extension = list(lnk.targets)[3].file_entry_extension()
+        raw_extension = list(raw.targets)[3].file_entry_extension()
+        self.assertEqual(str(extension.creation_time()), '2008-09-12 20:27:18+00:00')
+        self.assertEqual(raw_extension.creation_time(), 0xA369392C)
+
+        def times(value, key=''):
+            if isinstance(value, dict):
+                return [found for key, item in value.items() for found in times(item, key)]
+            if isinstance(value, list):
+                return [found for item in value for found in times(item, key)]
+            return [value] if key.endswith('_time') else []
+
+        found = 0
+        for entry in os.scandir(TARGET_DIR):
+            with self.subTest(msg=entry.name), open_sample(entry.path) as indata:
+                lnk = LnkParse3.lnk_file(indata=indata)
+                ns = LnkParse3.lnk_file(indata=indata, timestamps='epoch_ns')
+                ours = times(ns.get_json(get_all=True))
+                theirs = times(lnk.get_json(get_all=True))
+                self.assertNotIn(datetime.datetime, [type(value) for value in ours])
+                self.assertEqual(ours, times(lnk.get_json(get_all=True, timestamps='epoch_ns')))
+                found += len(ours)
+                for value, expected in zip(ours, theirs, strict=True):
+                    if value is not None and expected is not None:
+                        self.assertAlmostEqual(value / 10**9, expected.timestamp(), places=5)
+        self.assertGreater(found, 0)
+
+    def test_dostime_epoch_ns(self):
+        for dos in (0, 0xA3A9392C, 0x39283A3A, 0x00210021, 0xBF7F0021, 0x0021FF9F, 0x0A0A0A00):
+            with self.subTest(dos=hex(dos)):
+                binary = struct.pack('<I', dos)
+                diagnostics, ns_diagnostics = Diagnostics(), Diagnostics()
+                value = parse_dostime(binary, diagnostics)
+                value_ns = parse_dostime(binary, ns_diagnostics, 'epoch_ns')
+                expected = None if value is None else int(value.timestamp()) * 10**9
+                self.assertEqual(value_ns, expected)
+                self.assertEqual(ns_diagnostics.counts, diagnostics.counts)
+                self.assertEqual(parse_dostime(binary, diagnostics, 'raw'), dos)
+
+    def test_filetime_range(self):
+        diagnostics = Diagnostics()
+        utc_min = datetime.datetime.min.replace(tzinfo=FILETIME_EPOCH.tzinfo)
+        utc_max = datetime.datetime.max.replace(tzinfo=FILETIME_EPOCH.tzinfo)
+
+        def parse(filetime):
+            return parse_filetime(struct.pack('<q', filetime), diagnostics)
+
+        self.assertEqual(parse(MIN_FILETIME), utc_min)
+        self.assertEqual(parse(MAX_FILETIME), utc_max)
+        self.assertIsNone(parse(MIN_FILETIME - 1))
+        self.assertIsNone(parse(MAX_FILETIME + 1))
+        self.assertEqual(diagnostics.counts, {'invalid-filetime': 2})
+
+        # CreationTime of the header at offset 0x1C
+        with open_sample('tests/samples/microsoft_example') as indata:
+            for filetime in range(MAX_FILETIME - 5, MAX_FILETIME + 6):
+                patched = indata[:0x1C] + struct.pack('<q', filetime) + indata[0x24:]
+                header = LnkParse3.lnk_file(indata=patched).get_json()['header']
+                expected = utc_max if filetime <= MAX_FILETIME else None
+                self.assertEqual(header['creation_time'], expected)
+
+    def test_parse_uuid(self):
+        binary = bytes.fromhex('e04fd020ea3a6910a2d808002b30309d')
+        uuid = parse_uuid(memoryview(b'junk' + binary)[4:])
+
+        self.assertEqual(uuid, '20D04FE0-3AEA-1069-A2D8-08002B30309D')
+        self.assertIs(parse_uuid(bytearray(binary)), uuid)
+        self.assertEqual(guid_name(uuid), 'My Computer')
+        self.assertEqual(guid_name(uuid.lower()), 'My Computer')
+        self.assertIsNone(guid_name('00000000-0000-0000-0000-000000000000'))
+
+    def test_parse_packed_uuid(self):
+        # Example from the `Darwin` docstring
+        self.assertEqual(
+            parse_packed_uuid('w_1^VX!!!!!!!!!MKKSk'), '91120000-0030-0000-0000-0000000FF1CE'
+        )
+        self.assertEqual(
+            parse_packed_uuid('tW{~$4Q]c@II=l2xaTO5'), '0638C49D-BB8B-4CD1-B191-052E8F325736'
+        )
+        self.assertIsNone(parse_packed_uuid(None))
+
+    def test_validation(self):
+        with open_sample('tests/samples/microsoft_example') as indata:
+            # Reserved1 at offset 66 MUST be zero.
+            indata = indata[:66] + b'\x01\x00' + indata[68:]
+
+        lnk = LnkParse3.lnk_file(indata=indata)
+        lnk.header.reserved0()
+        lnk.get_json()
+        self.assertEqual(lnk.diagnostics.messages(), ['reserved0 must be 0: 1'])
+
+        lnk = LnkParse3.lnk_file(indata=indata, validation='off')
+        self.assertEqual(lnk.header.reserved0(), 1)
+        self.assertEqual(len(lnk.diagnostics), 0)
+
+        with self.assertRaises(LnkParserError):
+            LnkParse3.lnk_file(indata=indata, validation='strict')
+        with self.assertRaises(LnkParserError):
+            LnkParse3.lnk_file(indata=indata, validation='lenient')
+
+    def test_cached_fields(self):
+        with open_sample('tests/samples/microsoft_example') as indata:
+            lnk = LnkParse3.lnk_file(indata=indata)
+
+        creation_time = lnk.header.creation_time()
+        # Only the value is kept on the object.
+        self.assertIs(vars(lnk.header)['creation_time'], creation_time)
+        self.assertIs(lnk.header.creation_time(), creation_time)
+
+        label = lnk.info.volume_label_unicode()
+        self.assertIs(lnk.info.volume_label_unicode(), label)
+        self.assertEqual(lnk.get_json(), LnkParse3.lnk_file(indata=indata).get_json())
+
+    def test_id_list_scan(self):
+        for item_type in range(256):
+            masked = item_type & 0x70
+            expected = TargetFactory.SHELL_ITEM_CLASSES.get(
+                masked if masked in (0x20, 0x30, 0x40) else item_type
+            )
+            self.assertIs(TargetFactory.CLASS_TABLE[item_type], expected)
+
+        with open_sample('tests/samples/microsoft_example') as indata:
+            lnk = LnkParse3.lnk_file(indata=indata)
+
+        items = TargetFactory.scan(lnk.targets.raw_id_list())
+        self.assertEqual([size for _, size, _ in items], [20, 25, 70, 72])
+        self.assertEqual(items[1][0], items[0][1])
+
+        first, second = list(lnk.targets), list(lnk.targets)
+        self.assertEqual([type(target) for target in first], [cls for _, _, cls in items])
+        self.assertIs(first[0], second[0])
+        self.assertEqual(lnk.targets.as_list(), lnk.targets.as_list())
+
+    def test_item_cache_threads(self):
+        blobs = []
+        for entry in sorted(os.scandir(TARGET_DIR), key=lambda e: e.name):
+            with open_sample(entry.path) as indata:
+                blobs.append(indata)
+        expected = [LnkParse3.lnk_file(indata=indata).get_json(True) for indata in blobs]
+
+        def parse_all(cache):
+            return [LnkParse3.lnk_file(indata=indata, item_cache=cache).get_json(True) for indata in blobs]
+
+        single = ItemCache(maxsize=2)
+        parse_all(single)
+
+        # A small cache shared by threads evicts constantly.
+        cache = ItemCache(maxsize=2)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(parse_all, [cache] * 8))
+        self.assertEqual(results, [expected] * 8)
+        self.assertEqual(cache.hits + cache.misses, 8 * (single.hits + single.misses))
+        self.assertLessEqual(len(cache), 2)
+
+    def test_item_cache(self):
+        cache = ItemCache(maxsize=8)
+        for _ in range(2):
+            for entry in os.scandir(TARGET_DIR):
+                with self.subTest(msg=entry.name), open_sample(entry.path) as indata:
+                    lnk = LnkParse3.lnk_file(indata=indata)
+                    cached = LnkParse3.lnk_file(indata=indata, item_cache=cache)
+
+                    self.assertEqual(cached.get_json(True), lnk.get_json(True))
+                    self.assertEqual(cached.diagnostics.messages(), lnk.diagnostics.messages())
+
+        self.assertGreater(cache.hits, 0)
+        self.assertLessEqual(len(cache), 8)
+
+        with open_sample('tests/samples/microsoft_example') as indata:
+            first = LnkParse3.lnk_file(indata=indata, item_cache=cache)
+            second = LnkParse3.lnk_file(indata=bytes(indata), item_cache=cache)
+        self.assertIs(next(iter(first.targets)), next(iter(second.targets)))
+
+        # An anomaly in an extension block, which `get_json` never decodes,
+        # reaches the caller's sink when it is read and the item is not shared.
+        patched = indata[:221] + b'\xff\xff\xff\xff' + indata[225:]
+        lnk = LnkParse3.lnk_file(indata=patched)
+        cached = LnkParse3.lnk_file(indata=patched, item_cache=cache)
+        self.assertEqual(cached.get_json(True), lnk.get_json(True))
+        self.assertEqual(cached.diagnostics.messages(), lnk.diagnostics.messages())
+        for parsed in (lnk, cached):
+            list(parsed.targets)[3].file_entry_extension().creation_time()
+        self.assertEqual(cached.diagnostics.messages(), lnk.diagnostics.messages())
+        self.assertEqual(lnk.diagnostics.counts, {'invalid-dostime': 1})
+        again = LnkParse3.lnk_file(indata=patched, item_cache=cache)
+        self.assertIsNot(list(again.targets)[3], list(cached.targets)[3])
+
+        # The name is not terminated within its item, it runs into the size
+        # field of the next one (0x0032, i.e. '2\x00').
+        folder = b'\x31\x00' + bytes(8) + b'\x10\x00' + b'System3'
+        file = b'\x32\x00' + bytes(8) + b'\x20\x00' + b'cmd.exe'.ljust(36, b'\x00')
+        id_list = struct.pack('<H', len(folder) + 2) + folder
+        id_list += struct.pack('<H', len(file) + 2) + file + b'\x00\x00'
+        indata = struct.pack('<H', len(id_list)) + id_list
+
+        ours = LnkTargets(indata=indata, diagnostics=Diagnostics()).as_list()
+        for _ in range(2):
+            cached = LnkTargets(indata=indata, diagnostics=Diagnostics(), item_cache=cache)
+            self.assertEqual(cached.as_list(), ours)
+        self.assertEqual(ours[0]['primary_name'], 'System32')
+
+    def test_target_path(self):
+        paths = {}
+        for name in ('microsoft_example', 'network_info', 'sample', 'unknown_target'):
+            with open_sample(f'tests/samples/{name}') as indata:
+                paths[name] = LnkParse3.lnk_file(indata=indata).targets.path()
+
+        self.assertEqual(paths['microsoft_example'], 'C:\\test\\a.txt')
+        self.assertTrue(paths['network_info'].startswith('Z:\\AML24F~C\\'))
+        # The inner file entries of the users files folders.
+        self.assertEqual(paths['sample'], 'AppData\\Roaming\\.minecraft')
+
+        with open_sample('tests/samples/sample') as indata:
+            users_files_folder = list(LnkParse3.lnk_file(indata=indata).targets)[1]
+        self.assertIs(users_files_folder.file_entry(), users_files_folder.file_entry())
+        self.assertIsNone(paths['unknown_target'])
+
+    def test_extension_blocks(self):
+        with open_sample('tests/samples/microsoft_example') as indata:
+            root, _, folder, file = LnkParse3.lnk_file(indata=indata).targets
+
+        # Nothing is decoded until the blocks are asked for.
+        self.assertNotIn('extension_block_index', vars(file))
+        self.assertEqual(root.extension_blocks(), ())
+        self.assertIsNone(root.extension_block())
+        self.assertEqual(file.extension_block_index(), ((18, 52, 0xBEEF0004),))
+
+        extension = file.file_entry_extension()
+        self.assertEqual(extension.version(), 7)
+        self.assertEqual((extension.mft_entry(), extension.mft_sequence()), (28205, 406))
+        self.assertEqual(file.secondary_name(), 'a.txt')
+        self.assertEqual(folder.secondary_name(), 'test')
+
+        with open_sample('tests/samples/sample16') as indata:
+            root, *_, recent = LnkParse3.lnk_file(indata=indata).targets
+
+        self.assertEqual(
+            str(root.timestamps_extension().creation_time()), '2020-02-20 11:04:45.407764+00:00'
+        )
+        self.assertIs(root.extension_block(), root.timestamps_extension())
+        self.assertEqual(
+            [block.signature() for block in recent.extension_blocks()], [0xBEEF0004, 0xBEEF0003]
+        )
+        self.assertEqual(recent.file_entry_extension().localized_name(), '@shell32.dll,-21797')
+
+        # The localized name starts after the raw terminator, even when the
+        # long name is undecodable.
+        names = 'a\ud800'.encode('utf-16-le', 'surrogatepass') + b'\x00\x00' + b'@loc\x00'
+        body = bytes(10) + b'\x01\x00' + names + b'\x14\x00'
+        indata = struct.pack('<HHI', 8 + len(body), 3, 0xBEEF0004) + body
+        extension = FileEntryExtension(indata=indata, diagnostics=Diagnostics())
+        self.assertEqual(extension.long_name(), 'a\ufffd')
+        self.assertEqual(extension.localized_name(), '@loc')
+
+    def test_shell_item_id_list_copy(self):
+        with open_sample('tests/samples/microsoft_example') as indata:
+            lnk = LnkParse3.lnk_file(indata=indata)
+            start = lnk.section_index['extras'][0]
+            id_list = bytes(lnk.targets.raw_id_list())
+
+        def with_shell_item(id_list):
+            block = struct.pack('<II', 8 + len(id_list), 0xA000000C) + id_list
+            return LnkParse3.lnk_file(indata=indata[:start] + block + indata[start:])
+
+        copy = with_shell_item(id_list)
+        shell_item = copy.extras.data[0]
+        self.assertIs(shell_item.id_list_differs(), False)
+        # The copy reuses the parsed items of the LinkTargetIDList.
+        expected = copy.targets.as_list()
+        with mock.patch.object(TargetFactory, 'targets') as targets:
+            self.assertEqual(shell_item.as_dict()['id_list'], expected)
+        targets.assert_not_called()
+
+        tampered = with_shell_item(id_list.replace(b'a.txt', b'b.exe'))
+        block = tampered.get_json(True)['extra']['SHELL_ITEM_IDENTIFIER_BLOCK']
+        self.assertIs(block['id_list_differs'], True)
+        self.assertEqual(block['id_list'][-1]['primary_name'], 'b.exe')
+        self.assertEqual(tampered.targets.path(), 'C:\\test\\a.txt')
+
+    def test_header_link_flag_bits(self):
+        with open_sample('tests/samples/microsoft_example') as indata:
+            header = LnkHeader(indata=indata)
+
+        self.assertTrue(header.has_link_flag(LinkFlags.HAS_RELATIVE_PATH))
+        self.assertFalse(header.has_link_flag(LinkFlags.HAS_ARGUMENTS))
+        self.assertEqual(
+            header.link_flags(),
+            [name for mask, name in sorted(LnkHeader.LINK_FLAG_MASK.items()) if header.has_link_flag(mask)],
+        )
+
+    def test_truncated_header(self):
+        with open_sample('tests/samples/microsoft_example') as indata, \
+                self.assertRaises(LnkParserError):
+            LnkHeader(indata=indata[:40])
+
+    def test_lazy_matches_eager(self):
+        for entry in os.scandir(TARGET_DIR):
+            with self.subTest(msg=entry.name), open_sample(entry.path) as indata:
+                eager = LnkParse3.lnk_file(indata=indata)
+                lazy = LnkParse3.lnk_file(indata=indata, lazy=True)
+
+                self.assertEqual(lazy.size, eager.size)
+                self.assertEqual(lazy.section_index, eager.section_index)
+                self.assertEqual(lazy.get_json(get_all=True), eager.get_json(get_all=True))
+
+    def test_lazy_decodes_on_access(self):
+        with open_sample('tests/samples/microsoft_example') as indata:
+            buffer = bytearray(indata)
+
+        lnk = LnkParse3.lnk_file(indata=buffer, lazy=True)
+        relative_path = buffer.index(b'a\x00.\x00', lnk.section_index['string_data'][0])
+
+        # Decoded on the first access, not while parsing, and only once.
+        buffer[relative_path] = ord('b')
+        self.assertEqual(lnk.string_data.relative_path(), '.\\b.txt')
+        buffer[relative_path] = ord('c')
+        self.assertEqual(lnk.string_data.relative_path(), '.\\b.txt')
+        self.assertIs(lnk.header.creation_time(), lnk.header.creation_time())
+
+    def test_section_projection(self):
+        with open_sample('tests/samples/microsoft_example') as indata:
+            full = LnkParse3.lnk_file(indata=indata)
+            lnk = LnkParse3.lnk_file(indata=indata, sections={'header', 'string_data'})
+
+        self.assertIsNone(lnk.targets)
+        self.assertIsNone(lnk.info)
+        self.assertIsNone(lnk.extras)
+        self.assertEqual(lnk.size, full.size)
+        self.assertEqual(lnk.section_index, full.section_index)
+
+        our = lnk.get_json()
+        their = full.get_json()
+        self.assertEqual(our['header'], their['header'])
+        self.assertEqual(our['data'], their['data'])
+        self.assertNotIn('target', our)
+        self.assertNotIn('extra', our)
+
+    def test_unknown_section(self):
+        with open_sample('tests/samples/microsoft_example') as indata, \
+                self.assertRaises(LnkParserError):
+            LnkParse3.lnk_file(indata=indata, sections={'header', 'footer'})
+
+    def test_shortcut_target_fast_path(self):
+        for entry in os.scandir(TARGET_DIR):
+            with self.subTest(msg=entry.name), open_sample(entry.path) as indata:
+                lnk = LnkParse3.lnk_file(indata=indata)
+                self.assertEqual(LnkParse3.shortcut_target(indata=indata), lnk.lnk_command)
+
+                # Truncated in the middle of every section, the extractor
+                # must fail or fall back just as the full parser does.
+                for end in range(0, len(indata), 7):
+                    try:
+                        expected = LnkParse3.lnk_file(indata=indata[:end], validation='off').lnk_command
+                    except Exception as e:
+                        expected = type(e)
+                    try:
+                        actual = LnkParse3.shortcut_target(indata=indata[:end])
+                    except Exception as e:
+                        actual = type(e)
+                    self.assertEqual(actual, expected, end)
+
+    def test_parse_tree(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, 'nested').mkdir()
+            with open(os.path.join(tmp, 'not_a_link.txt'), 'wb') as fp:
+                fp.write(b'plain text')
+
+            expected = {}
+            for entry in os.scandir(TARGET_DIR):
+                path = os.path.join(tmp, 'nested', entry.name)
+                with open_sample(entry.path) as indata, open(path, 'wb') as fp:
+                    fp.write(indata)
+                    expected[path] = LnkParse3.shortcut_target(indata=indata)
+
+            for workers in (1, 2):
+                with self.subTest(workers=workers):
+                    records = parse_tree(tmp, workers=workers, target_only=True)
+                    ours = {record['path']: record['shortcut_target'] for record in records}
+                    self.assertDictEqual(ours, expected)
+
+    def test_path_trie(self):
+        trie = PathTrie()
+        first = trie.add('C:\\Users\\alice\\AppData\\Local\\Temp\\a.exe')
+        second = trie.add('c:\\users\\BOB\\appdata\\local\\temp\\b.exe')
+        other = trie.add('C:\\Users\\alice\\Desktop\\c.lnk')
+        share = trie.add('\\\\server\\share\\d.doc')
+
+        self.assertEqual(trie.add('C:\\USERS\\ALICE\\Desktop\\c.lnk'), other)
+        self.assertEqual(trie.count(other), 2)
+        self.assertEqual(trie.path(second), 'C:\\Users\\BOB\\appdata\\local\\temp\\b.exe')
+        self.assertEqual(trie.path(share), '\\\\server\\share\\d.doc')
+        self.assertEqual(trie.path(trie.find('c:\\users\\alice')), 'C:\\Users\\alice')
+        self.assertIsNone(trie.find('C:\\Windows'))
+        self.assertEqual(
+            sorted(trie.under('C:\\Users\\*\\AppData\\Local\\Temp')), sorted([first, second])
+        )
+        self.assertEqual(list(trie.under('C:\\Users\\alice\\Desktop\\c.lnk')), [other])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            expected = {}
+            for entry in os.scandir(TARGET_DIR):
+                path = os.path.join(tmp, entry.name)
+                with open_sample(entry.path) as indata, open(path, 'wb') as fp:
+                    fp.write(indata)
+                    expected[path] = LnkParse3.lnk_file(indata=indata).target_path()
+
+            trie = PathTrie()
+            nodes = dict(index_target_paths(iter_files(tmp), trie, workers=1))
+            # Nodes keep the spelling of the first path, e.g. `System32`.
+            self.assertDictEqual(
+                {path: node and trie.path(node).casefold() for path, node in nodes.items()},
+                {path: target and target.casefold() for path, target in expected.items()},
+            )
+        self.assertEqual(expected[os.path.join(tmp, 'microsoft_example')], 'C:\\test\\a.txt')
+
+    def test_ndjson_writer(self):
+        ours = StringIO()
+        theirs = []
+        with NDJSONWriter(ours) as writer:
+            for entry in os.scandir(TARGET_DIR):
+                with open_sample(entry.path) as indata:
+                    lnk = LnkParse3.lnk_file(indata=indata)
+
+                writer.write(json_ready(lnk.get_json(True)))
+
+                mock_stdout = StringIO()
+                with redirect_stdout(mock_stdout):
+                    lnk.print_json(print_all=True)
+                theirs.append(json.loads(mock_stdout.getvalue()))
+
+        lines = ours.getvalue().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], theirs)
+
+    def test_from_path_mmap(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for entry in os.scandir(TARGET_DIR):
+                with self.subTest(msg=entry.name):
+                    path = os.path.join(tmp, entry.name)
+                    with open_sample(entry.path) as indata, open(path, 'wb') as fp:
+                        fp.write(indata)
+                        their = LnkParse3.lnk_file(indata=indata).get_json(True)
+
+                    for mmap in (False, True):
+                        lnk = LnkParse3.lnk_file.from_path(path, mmap=mmap)
+                        self.assertEqual(lnk.get_json(True), their)
+                        del lnk
+
+    def test_aparse_many(self):
+        blobs = []
+        for entry in sorted(os.scandir(TARGET_DIR), key=lambda e: e.name):
+            with open_sample(entry.path) as indata:
+                blobs.append(indata)
+
+        async def items():
+            for blob in blobs:
+                yield blob
+
+        async def collect(source):
+            records = aparse_many(source, batch_size=5, max_pending=2, target_only=True)
+            return [record async for record in records]
+
+        for source in (blobs, items()):
+            with self.subTest(source=type(source).__name__):
+                ours = {r['index']: r['shortcut_target'] for r in asyncio.run(collect(source))}
+                their = {i: LnkParse3.shortcut_target(indata=blob) for i, blob in enumerate(blobs)}
+                self.assertDictEqual(ours, their)
+
+    def test_read_strings(self):
+        text_processor = TextProcessor()
+        binary = memoryview(b'junk' + b'first\x00caf\xe9\x00\xc3\xa9t\xc3\xa9\x00\x81\x00tail')[4:]
+
+        self.assertEqual(text_processor.read_string(binary), 'first')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            ours = list(text_processor.read_strings(binary))
+        # cp1252 fails on 0x81, UTF-8 too, so it is replaced and reported.
+        self.assertEqual(ours, ['first', 'café', 'Ã©tÃ©', '\ufffd', 'tail'])
+        self.assertEqual(len(caught), 1)
+        self.assertEqual(list(text_processor.read_strings(b'')), [''])
+
+    def test_read_unicode_strings(self):
+        text_processor = TextProcessor()
+        # 'A\u0100' encodes to 41 00 00 01, its zero pair straddles two code
+        # units and must not be taken for a terminator.
+        binary = memoryview('A\u0100\x00bc\x00'.encode('utf-16le') + b'd')
+
+        self.assertEqual(text_processor.read_unicode_string(binary), 'A\u0100')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            ours = list(text_processor.read_unicode_strings(binary))
+        # The odd trailing byte cannot be decoded, it is replaced and reported.
+        self.assertEqual(ours, ['A\u0100', 'bc', '\ufffd'])
+        self.assertEqual(len(caught), 1)
+        self.assertEqual(list(text_processor.read_unicode_strings(b'')), [''])
+
 
 if __name__ == '__main__':
     unittest.main()